@@ -3,13 +3,15 @@ API routes for Task endpoints.
 Implements POST, GET, PUT, DELETE operations.
 """
 import math
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.database import get_db
-from app.models.task import TaskPriority, TaskStatus
+from app.db.database import get_db, get_session_factory
+from app.models.task import SummaryStatus, TaskPriority, TaskStatus
 from app.schemas.task import (
     TaskCreate,
     TaskDeleteResponse,
@@ -17,18 +19,32 @@ from app.schemas.task import (
     TaskResponse,
     TaskUpdate,
 )
+from app.services.cache import ResponseCache
 from app.services.openai_client import OpenAIClient, get_openai_client
-from app.services.task_service import TaskService
+from app.services.summary_batcher import SummaryBatcher, get_summary_batcher
+from app.services.task_service import TaskService, encode_cursor, get_task_cache
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Validates a whole page of ORM rows in one pass instead of per-model calls
+_task_list_adapter = TypeAdapter(List[TaskResponse])
+
 
 def get_task_service(
     db: AsyncSession = Depends(get_db),
     openai_client: OpenAIClient = Depends(get_openai_client),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    task_cache: Optional[ResponseCache] = Depends(get_task_cache),
+    summary_batcher: Optional[SummaryBatcher] = Depends(get_summary_batcher),
 ) -> TaskService:
     """Dependency injection for TaskService."""
-    return TaskService(db=db, openai_client=openai_client)
+    return TaskService(
+        db=db,
+        openai_client=openai_client,
+        session_factory=session_factory,
+        cache=task_cache,
+        summary_batcher=summary_batcher,
+    )
 
 
 @router.post(
@@ -37,16 +53,20 @@ def get_task_service(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
     description="Create a new task with optional AI-generated summary. "
-    "The summary is generated using OpenAI's GPT model based on the task title and description.",
+    "The summary is generated in the background using OpenAI's GPT model based on "
+    "the task title and description; poll the task to retrieve it.",
     responses={
         201: {"description": "Task created successfully"},
+        202: {"description": "Task created, summary generation pending"},
         422: {"description": "Validation error"},
-        502: {"description": "External API error (summary generation failed)"},
         503: {"description": "Database connection error"},
     },
 )
 async def create_task(
     task_data: TaskCreate,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    response: Response,
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """
@@ -58,7 +78,14 @@ async def create_task(
     - **due_date**: Optional due date
     - **generate_summary**: Whether to generate AI summary (default: true)
     """
-    task, _ = await service.create_task(task_data)
+    task, _ = await service.create_task(task_data, defer_summary=True)
+
+    if task.summary_status == SummaryStatus.PENDING:
+        background_tasks.add_task(service.refresh_summary, task.id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        # Where to poll for the finished summary
+        response.headers["Location"] = str(request.url_for("get_task", task_id=task.id))
+
     return TaskResponse.model_validate(task)
 
 
@@ -67,9 +94,11 @@ async def create_task(
     response_model=TaskListResponse,
     status_code=status.HTTP_200_OK,
     summary="Get all tasks",
-    description="Retrieve a paginated list of tasks with optional filtering by status and priority.",
+    description="Retrieve a paginated list of tasks with optional filtering by status and priority. "
+    "Pass the returned next_cursor as cursor to page efficiently through large result sets.",
     responses={
         200: {"description": "Tasks retrieved successfully"},
+        422: {"description": "Invalid query parameters or cursor"},
         503: {"description": "Database connection error"},
     },
 )
@@ -82,8 +111,17 @@ async def get_tasks(
     priority_filter: Optional[TaskPriority] = Query(
         None, alias="priority", description="Filter by task priority"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous response (overrides page)"
+    ),
+    include_total: bool = Query(
+        False, description="Include the total task count (issues a COUNT query)"
+    ),
+    estimate_total: bool = Query(
+        False, description="Use a fast row estimate for the unfiltered total"
+    ),
     service: TaskService = Depends(get_task_service),
-) -> TaskListResponse:
+) -> Response:
     """
     Get paginated list of tasks.
     
@@ -91,22 +129,75 @@ async def get_tasks(
     - **page_size**: Tasks per page (default: 10, max: 100)
     - **status**: Optional status filter
     - **priority**: Optional priority filter
+    - **cursor**: Optional keyset cursor (next_cursor of the previous page)
+    - **include_total**: Whether to compute total and total_pages (default: false)
+    - **estimate_total**: Allow an approximate total when no filters are applied
     """
-    tasks, total = await service.get_tasks(
+    tasks, total, has_more = await service.get_tasks(
         page=page,
         page_size=page_size,
         status=status_filter,
         priority=priority_filter,
+        cursor=cursor,
+        include_total=include_total,
+        estimate_total=estimate_total,
     )
     
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    total_pages = math.ceil(total / page_size) if total is not None else None
+    next_cursor = encode_cursor(tasks[-1]) if has_more else None
     
-    return TaskListResponse(
-        tasks=[TaskResponse.model_validate(task) for task in tasks],
+    # Serialize here and return raw JSON so FastAPI skips re-validating
+    # every row against response_model
+    payload = TaskListResponse.model_construct(
+        tasks=_task_list_adapter.validate_python(tasks, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream all tasks",
+    description="Stream every matching task as newline-delimited JSON, newest first. "
+    "Memory use is bounded by the fetch batch, so this suits exports of large task sets. "
+    "A database error after streaming starts ends the body with a final error record "
+    "(`success: false`, `error_code: DATABASE_ERROR`) under the 200 status.",
+    responses={
+        200: {
+            "description": "Tasks streamed successfully",
+            "content": {"application/x-ndjson": {}},
+        },
+        422: {"description": "Invalid query parameters"},
+    },
+)
+async def stream_tasks(
+    status_filter: Optional[TaskStatus] = Query(
+        None, alias="status", description="Filter by task status"
+    ),
+    priority_filter: Optional[TaskPriority] = Query(
+        None, alias="priority", description="Filter by task priority"
+    ),
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    """
+    Stream tasks as NDJSON (one task object per line).
+    
+    - **status**: Optional status filter
+    - **priority**: Optional priority filter
+    
+    The status line is sent before rows are read, so a database failure
+    mid-stream is reported as a final error record rather than a 5xx.
+    """
+    return StreamingResponse(
+        service.stream_tasks(status=status_filter, priority=priority_filter),
+        media_type="application/x-ndjson",
     )
 
 
@@ -141,9 +232,10 @@ async def get_task(
     status_code=status.HTTP_200_OK,
     summary="Update a task",
     description="Update an existing task. All fields are optional. "
-    "Set regenerate_summary to true to generate a new AI summary.",
+    "Set regenerate_summary to true to generate a new AI summary in the background.",
     responses={
         200: {"description": "Task updated successfully"},
+        202: {"description": "Task updated, summary regeneration pending"},
         404: {"description": "Task not found"},
         422: {"description": "Validation error"},
         503: {"description": "Database connection error"},
@@ -152,6 +244,8 @@ async def get_task(
 async def update_task(
     task_id: str,
     task_data: TaskUpdate,
+    background_tasks: BackgroundTasks,
+    response: Response,
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """
@@ -165,7 +259,12 @@ async def update_task(
     - **due_date**: Updated due date (optional)
     - **regenerate_summary**: Whether to regenerate AI summary (default: false)
     """
-    task, _ = await service.update_task(task_id, task_data)
+    task, _ = await service.update_task(task_id, task_data, defer_summary=True)
+
+    if task_data.regenerate_summary and task.summary_status == SummaryStatus.PENDING:
+        background_tasks.add_task(service.refresh_summary, task.id)
+        response.status_code = status.HTTP_202_ACCEPTED
+
     return TaskResponse.model_validate(task)
 
 
@@ -191,7 +290,7 @@ async def delete_task(
     - **task_id**: UUID of the task to delete
     """
     deleted_id = await service.delete_task(task_id)
-    return TaskDeleteResponse(
+    return TaskDeleteResponse.model_construct(
         message="Task deleted successfully",
         deleted_id=deleted_id,
     )
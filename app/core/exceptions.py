@@ -5,9 +5,11 @@ from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from app.core.config import settings
+
 
 class AppException(Exception):
     """Base exception class for application-specific errors."""
@@ -29,12 +31,12 @@ class AppException(Exception):
 class TaskNotFoundException(AppException):
     """Exception raised when a task is not found."""
     
-    def __init__(self, task_id: str):
+    def __init__(self, task_id: Any):
         super().__init__(
             message=f"Task with ID '{task_id}' not found",
             status_code=status.HTTP_404_NOT_FOUND,
             error_code="TASK_NOT_FOUND",
-            details={"task_id": task_id},
+            details={"task_id": str(task_id)},
         )
 
 
@@ -69,6 +71,24 @@ class ExternalAPIError(AppException):
         )
 
 
+class RetryableExternalAPIError(ExternalAPIError):
+    """Exception raised for transient external API failures (429, 5xx, network)."""
+    
+    def __init__(
+        self,
+        message: str = "External API request failed",
+        service: str = "unknown",
+        original_error: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(
+            message=message,
+            service=service,
+            original_error=original_error,
+        )
+        self.retry_after = retry_after
+
+
 class ExternalAPITimeoutError(AppException):
     """Exception raised when external API request times out."""
     
@@ -103,11 +123,13 @@ class ErrorResponseModel(BaseModel):
 
 def setup_exception_handlers(app: FastAPI) -> None:
     """Register global exception handlers for the FastAPI application."""
+    # Resolved once at registration rather than on every error
+    expose_error_details = settings.DEBUG
 
     @app.exception_handler(AppException)
-    async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+    async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
         """Handle application-specific exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponseModel(
                 error=exc.message,
@@ -119,14 +141,14 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle Pydantic validation errors with detailed messages."""
         errors = []
         for error in exc.errors():
             field = " -> ".join(str(loc) for loc in error["loc"])
             errors.append(f"{field}: {error['msg']}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=ErrorResponseModel(
                 error="Validation failed",
@@ -136,14 +158,12 @@ def setup_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Handle unexpected exceptions."""
         # In production, don't expose internal error details
-        from app.core.config import settings
-        
-        error_message = str(exc) if settings.DEBUG else "An unexpected error occurred"
+        error_message = str(exc) if expose_error_details else "An unexpected error occurred"
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=ErrorResponseModel(
                 error=error_message,
@@ -13,9 +13,11 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 # Create async session factory
@@ -39,6 +41,14 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency injection for the session factory.
+    Used by background jobs that outlive the request-scoped session.
+    """
+    return async_session_maker
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency injection for database sessions.
@@ -2,17 +2,21 @@
 Task database model with SQLAlchemy ORM.
 """
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Enum, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DateTime, Enum, Index, String, Text, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
 
 
+def _utcnow() -> datetime:
+    """Naive UTC timestamp, matching the database's CURRENT_TIMESTAMP."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class TaskStatus(str, enum.Enum):
     """Enumeration for task status values."""
     PENDING = "pending"
@@ -29,6 +33,13 @@ class TaskPriority(str, enum.Enum):
     CRITICAL = "critical"
 
 
+class SummaryStatus(str, enum.Enum):
+    """Enumeration for AI summary generation states."""
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
 class Task(Base):
     """
     Task model representing a user task with AI-generated summary.
@@ -38,6 +49,7 @@ class Task(Base):
         title: Task title (required, max 200 chars)
         description: Detailed task description (required)
         summary: AI-generated summary of the task (nullable)
+        summary_status: Summary generation state (null if not requested)
         status: Current task status
         priority: Task priority level
         due_date: Optional due date for the task
@@ -46,14 +58,18 @@ class Task(Base):
     """
     __tablename__ = "tasks"
 
-    id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summary_status: Mapped[Optional[SummaryStatus]] = mapped_column(
+        Enum(SummaryStatus),
+        nullable=True,
+    )
     status: Mapped[TaskStatus] = mapped_column(
         Enum(TaskStatus),
         default=TaskStatus.PENDING,
@@ -65,24 +81,44 @@ class Task(Base):
         nullable=False,
     )
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Both timestamps come from one clock (_utcnow) on insert and update, in
+    # the same format as cursor binds; server defaults only cover raw inserts
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
+        default=_utcnow,
         server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
         nullable=False,
     )
 
     # Indexes for common query patterns
     __table_args__ = (
-        Index("idx_tasks_status", "status"),
+        # Filtered listing: WHERE status/priority ORDER BY created_at DESC, id DESC
+        Index(
+            "idx_tasks_status_priority_created_desc",
+            "status",
+            "priority",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Unfiltered listing and keyset cursors
+        Index("idx_tasks_created_id", "created_at", "id"),
+        # Priority-only filters (the composite index leads with status)
         Index("idx_tasks_priority", "priority"),
-        Index("idx_tasks_created_at", "created_at"),
+        # Due-date lookups across all statuses
         Index("idx_tasks_due_date", "due_date"),
+        # Pending tasks by due date (enum columns store member names)
+        Index(
+            "idx_tasks_pending_due",
+            "due_date",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
     )
 
     def __repr__(self) -> str:
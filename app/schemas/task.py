@@ -2,26 +2,32 @@
 Pydantic schemas for Task API request/response validation.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
-from app.models.task import TaskPriority, TaskStatus
+from app.models.task import SummaryStatus, TaskPriority, TaskStatus
+
+# Whitespace is stripped by pydantic-core before the length checks, so a
+# whitespace-only title or a padded short description is rejected
+TitleStr = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)
+]
+DescriptionStr = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=10, max_length=5000)
+]
 
 
 class TaskBase(BaseModel):
     """Base schema with common task fields."""
-    title: str = Field(
+    title: TitleStr = Field(
         ...,
-        min_length=1,
-        max_length=200,
         description="Task title (1-200 characters)",
         examples=["Complete project documentation"],
     )
-    description: str = Field(
+    description: DescriptionStr = Field(
         ...,
-        min_length=10,
-        max_length=5000,
         description="Detailed task description (10-5000 characters)",
         examples=["Write comprehensive documentation for the API including endpoints, examples, and error codes."],
     )
@@ -34,24 +40,6 @@ class TaskBase(BaseModel):
         description="Optional due date for the task",
     )
 
-    @field_validator("title")
-    @classmethod
-    def title_must_not_be_empty(cls, v: str) -> str:
-        """Validate that title is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Title cannot be empty or whitespace only")
-        return v.strip()
-
-    @field_validator("description")
-    @classmethod
-    def description_must_be_meaningful(cls, v: str) -> str:
-        """Validate that description has meaningful content."""
-        if not v.strip():
-            raise ValueError("Description cannot be empty or whitespace only")
-        if len(v.strip()) < 10:
-            raise ValueError("Description must be at least 10 characters")
-        return v.strip()
-
 
 class TaskCreate(TaskBase):
     """Schema for creating a new task."""
@@ -63,16 +51,12 @@ class TaskCreate(TaskBase):
 
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task. All fields are optional."""
-    title: Optional[str] = Field(
+    title: Optional[TitleStr] = Field(
         default=None,
-        min_length=1,
-        max_length=200,
         description="Updated task title",
     )
-    description: Optional[str] = Field(
+    description: Optional[DescriptionStr] = Field(
         default=None,
-        min_length=10,
-        max_length=5000,
         description="Updated task description",
     )
     status: Optional[TaskStatus] = Field(
@@ -92,34 +76,18 @@ class TaskUpdate(BaseModel):
         description="Whether to regenerate AI summary",
     )
 
-    @field_validator("title")
-    @classmethod
-    def title_must_not_be_empty(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that title is not just whitespace if provided."""
-        if v is not None and not v.strip():
-            raise ValueError("Title cannot be empty or whitespace only")
-        return v.strip() if v else v
-
-    @field_validator("description")
-    @classmethod
-    def description_must_be_meaningful(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that description has meaningful content if provided."""
-        if v is not None:
-            if not v.strip():
-                raise ValueError("Description cannot be empty or whitespace only")
-            if len(v.strip()) < 10:
-                raise ValueError("Description must be at least 10 characters")
-        return v.strip() if v else v
-
 
 class TaskResponse(BaseModel):
     """Schema for task response with all fields."""
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(..., description="Unique task identifier (UUID)")
+    id: UUID = Field(..., description="Unique task identifier (UUID)")
     title: str = Field(..., description="Task title")
     description: str = Field(..., description="Task description")
     summary: Optional[str] = Field(None, description="AI-generated task summary")
+    summary_status: Optional[SummaryStatus] = Field(
+        None, description="AI summary generation state (null if not requested)"
+    )
     status: TaskStatus = Field(..., description="Current task status")
     priority: TaskPriority = Field(..., description="Task priority level")
     due_date: Optional[datetime] = Field(None, description="Task due date")
@@ -130,16 +98,24 @@ class TaskResponse(BaseModel):
 class TaskListResponse(BaseModel):
     """Schema for paginated task list response."""
     tasks: List[TaskResponse] = Field(..., description="List of tasks")
-    total: int = Field(..., ge=0, description="Total number of tasks")
+    total: Optional[int] = Field(
+        None, ge=0, description="Total number of tasks (only when include_total is set)"
+    )
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, le=100, description="Number of tasks per page")
-    total_pages: int = Field(..., ge=0, description="Total number of pages")
+    total_pages: Optional[int] = Field(
+        None, ge=0, description="Total number of pages (only when include_total is set)"
+    )
+    has_more: bool = Field(..., description="Whether more tasks exist after this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for fetching the next page, if any"
+    )
 
 
 class TaskDeleteResponse(BaseModel):
     """Schema for task deletion response."""
     message: str = Field(..., description="Deletion confirmation message")
-    deleted_id: str = Field(..., description="ID of the deleted task")
+    deleted_id: UUID = Field(..., description="ID of the deleted task")
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,135 @@
+"""
+Async response cache backends for memoizing external API results.
+"""
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(ABC):
+    """Minimal async key/value cache interface with per-entry TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on miss/expiry."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """Store value under key for ttl seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Process-local TTL + LRU cache.
+
+    Entries expire after their TTL and the least recently used entry is
+    evicted once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = 1024, default_ttl: int = 3600):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        async with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisResponseCache(ResponseCache):
+    """Redis-backed cache shared across workers and processes."""
+
+    def __init__(self, url: str, default_ttl: int = 3600, prefix: str = "cache:"):
+        from redis import asyncio as aioredis
+
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self._redis = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        await self._redis.set(
+            self.prefix + key,
+            value,
+            ex=ttl if ttl is not None else self.default_ttl,
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self.prefix + key)
+
+
+def build_response_cache() -> Optional[ResponseCache]:
+    """
+    Build the summary cache configured in settings.
+
+    Returns None when caching is disabled (SUMMARY_CACHE_TTL <= 0).
+    """
+    if settings.SUMMARY_CACHE_TTL <= 0:
+        return None
+
+    if settings.REDIS_URL:
+        logger.info("Using Redis response cache")
+        return RedisResponseCache(
+            settings.REDIS_URL,
+            default_ttl=settings.SUMMARY_CACHE_TTL,
+            prefix="summary:",
+        )
+
+    return InMemoryResponseCache(
+        max_size=settings.SUMMARY_CACHE_MAX_SIZE,
+        default_ttl=settings.SUMMARY_CACHE_TTL,
+    )
+
+
+def build_task_cache() -> Optional[ResponseCache]:
+    """
+    Build the task read-through cache configured in settings.
+
+    Only Redis is used: tasks are mutable, and a process-local cache would
+    serve stale rows after another worker's write. Returns None when
+    REDIS_URL is unset or TASK_CACHE_TTL <= 0.
+    """
+    if not settings.REDIS_URL or settings.TASK_CACHE_TTL <= 0:
+        return None
+
+    return RedisResponseCache(
+        settings.REDIS_URL,
+        default_ttl=settings.TASK_CACHE_TTL,
+        prefix="task:",
+    )
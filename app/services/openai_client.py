@@ -1,22 +1,76 @@
 """
 External API client for OpenAI integration with retry logic and error handling.
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
 
-from app.core.config import settings
-from app.core.exceptions import ExternalAPIError, ExternalAPITimeoutError
+from app.core.config import Settings, settings
+from app.core.exceptions import (
+    ExternalAPIError,
+    ExternalAPITimeoutError,
+    RetryableExternalAPIError,
+)
+from app.services.cache import ResponseCache, build_response_cache
 
 logger = logging.getLogger(__name__)
 
+_backoff = wait_exponential_jitter(initial=1, max=10)
+
+_MAX_TITLE_CHARS = 200
+
+# Streamed summaries stop once this many sentences have been produced
+_MAX_SUMMARY_SENTENCES = 3
+# A sentence end only counts once the following whitespace has arrived, so
+# "3." split from "14" across chunks is not taken for one
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+_PROMPT_TEMPLATE = """You are a task management assistant. Generate a brief, actionable summary (2-3 sentences max) for the following task.
+
+Task Title: {title}
+
+Task Description: {description}
+
+Summary:"""
+
+_BATCH_PROMPT_TEMPLATE = """You are a task management assistant. Generate a brief, actionable summary (2-3 sentences max) for each of the following {count} tasks.
+
+Respond with only a JSON array of {count} strings, one summary per task, in the order given.
+
+{tasks}"""
+
+_BATCH_TASK_TEMPLATE = """Task {number} Title: {title}
+Task {number} Description: {description}"""
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant that creates concise task summaries.",
+}
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After hint if given, else back off with jitter."""
+    error = retry_state.outcome.exception()
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        client = retry_state.args[0]
+        return min(retry_after, client.timeout)
+    return _backoff(retry_state)
+
 
 class OpenAIClient:
     """
@@ -25,15 +79,46 @@ class OpenAIClient:
     Features:
     - Automatic retry with exponential backoff
     - Timeout handling
+    - Bounded request concurrency
     - Proper error mapping
+    - Optional exact-match response cache
+    - Coalescing of concurrent identical requests
+    - Optional streamed completions with early stop
     """
 
-    def __init__(self):
-        self.api_key = settings.OPENAI_API_KEY
-        self.api_url = settings.OPENAI_API_URL
-        self.model = settings.OPENAI_MODEL
-        self.timeout = settings.EXTERNAL_API_TIMEOUT
-        self.max_retries = settings.EXTERNAL_API_MAX_RETRIES
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        config: Optional[Settings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        config = config or settings
+        self.api_key = config.OPENAI_API_KEY
+        self.api_url = config.OPENAI_API_URL
+        self.model = config.OPENAI_MODEL
+        self.timeout = config.EXTERNAL_API_TIMEOUT
+        self.max_retries = config.EXTERNAL_API_MAX_RETRIES
+        self.max_description_chars = config.SUMMARY_MAX_DESCRIPTION_CHARS
+        self.stream = config.OPENAI_STREAM
+        # Fixed request parameters, shared by every summary payload
+        self._base_payload = {
+            "model": self.model,
+            "max_tokens": 150,
+            "temperature": 0.7,
+        }
+        self.cache = cache
+        self.cache_ttl = config.SUMMARY_CACHE_TTL
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Caps in-flight API calls to stay within the account's rate limits
+        self._semaphore = asyncio.Semaphore(config.OPENAI_MAX_CONCURRENCY)
+        # Shared client so connections (and TLS sessions) are reused across calls
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers=self._get_headers(),
+            transport=transport,
+        )
 
     def _get_headers(self) -> dict:
         """Get headers for API requests."""
@@ -42,10 +127,42 @@ class OpenAIClient:
             "Content-Type": "application/json",
         }
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self._client.aclose()
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given as seconds or an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    @staticmethod
+    def _cache_key(payload: dict) -> str:
+        """Build a stable cache key from the canonicalized request payload."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+
     @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        retry=retry_if_exception_type(
+            (
+                httpx.TimeoutException,
+                httpx.NetworkError,
+                ExternalAPITimeoutError,
+                RetryableExternalAPIError,
+            )
+        ),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_wait_for_retry,
         reraise=True,
     )
     async def _make_request(self, payload: dict) -> dict:
@@ -61,59 +178,146 @@ class OpenAIClient:
         Raises:
             ExternalAPIError: If the API request fails
             ExternalAPITimeoutError: If the request times out
+            RetryableExternalAPIError: On rate limits, server or network
+                errors (retried before being raised)
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._semaphore:
             try:
-                response = await client.post(
-                    self.api_url,
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                
-                if response.status_code == 401:
-                    raise ExternalAPIError(
-                        message="OpenAI API authentication failed",
-                        service="OpenAI",
-                        original_error="Invalid API key",
-                    )
-                
-                if response.status_code == 429:
-                    raise ExternalAPIError(
-                        message="OpenAI API rate limit exceeded",
-                        service="OpenAI",
-                        original_error="Rate limit exceeded",
-                    )
-                
-                if response.status_code >= 500:
-                    raise ExternalAPIError(
-                        message="OpenAI API server error",
-                        service="OpenAI",
-                        original_error=f"HTTP {response.status_code}",
-                    )
-                
-                response.raise_for_status()
+                response = await self._client.post(self.api_url, json=payload)
+                self._check_response(response)
                 return response.json()
-                
-            except httpx.TimeoutException as e:
-                logger.error(f"OpenAI API timeout: {e}")
-                raise ExternalAPITimeoutError(
-                    service="OpenAI",
-                    timeout=self.timeout,
-                )
-            except httpx.HTTPStatusError as e:
-                logger.error(f"OpenAI API HTTP error: {e}")
-                raise ExternalAPIError(
-                    message="OpenAI API request failed",
-                    service="OpenAI",
-                    original_error=str(e),
-                )
-            except httpx.NetworkError as e:
-                logger.error(f"OpenAI API network error: {e}")
-                raise ExternalAPIError(
-                    message="Network error connecting to OpenAI API",
-                    service="OpenAI",
-                    original_error=str(e),
-                )
+            except httpx.HTTPError as e:
+                raise self._translate_error(e)
+
+    @retry(
+        retry=retry_if_exception_type(
+            (
+                httpx.TimeoutException,
+                httpx.NetworkError,
+                ExternalAPITimeoutError,
+                RetryableExternalAPIError,
+            )
+        ),
+        stop=stop_after_attempt(3),
+        wait=_wait_for_retry,
+        reraise=True,
+    )
+    async def _stream_request(self, payload: dict) -> str:
+        """
+        Stream a chat completion and assemble its content.
+        
+        Stops reading once the summary holds _MAX_SUMMARY_SENTENCES complete
+        sentences, which closes the stream and ends generation early.
+        
+        Args:
+            payload: Request payload for the API
+            
+        Returns:
+            Assembled completion text
+            
+        Raises:
+            ExternalAPIError: If the API request fails
+            ExternalAPITimeoutError: If the request times out
+            RetryableExternalAPIError: On rate limits, server or network
+                errors (retried before being raised)
+        """
+        text = ""
+        async with self._semaphore:
+            try:
+                async with self._client.stream(
+                    "POST", self.api_url, json={**payload, "stream": True}
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                    self._check_response(response)
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+
+                        try:
+                            choices = json.loads(data).get("choices") or []
+                            content = choices[0].get("delta", {}).get("content") if choices else None
+                            if content is not None and not isinstance(content, str):
+                                raise TypeError(f"content is {type(content).__name__}")
+                        except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                            logger.warning(f"Skipping malformed OpenAI stream chunk: {data[:100]}")
+                            continue
+                        if not content:
+                            continue
+
+                        # Count on the accumulated text: a sentence end can
+                        # straddle two chunks
+                        text += content
+                        ends = list(_SENTENCE_END.finditer(text))
+                        if len(ends) >= _MAX_SUMMARY_SENTENCES:
+                            text = text[:ends[_MAX_SUMMARY_SENTENCES - 1].end()]
+                            break
+            except httpx.HTTPError as e:
+                raise self._translate_error(e)
+
+        return text
+
+    def _check_response(self, response: httpx.Response) -> None:
+        """
+        Map an error status code to the matching API exception.
+        
+        Args:
+            response: Response whose status is checked
+            
+        Raises:
+            ExternalAPIError: On authentication or other client errors
+            RetryableExternalAPIError: On rate limits or server errors
+        """
+        if response.status_code == 401:
+            raise ExternalAPIError(
+                message="OpenAI API authentication failed",
+                service="OpenAI",
+                original_error="Invalid API key",
+            )
+
+        if response.status_code == 429:
+            raise RetryableExternalAPIError(
+                message="OpenAI API rate limit exceeded",
+                service="OpenAI",
+                original_error="Rate limit exceeded",
+                retry_after=self._parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        if response.status_code >= 500:
+            raise RetryableExternalAPIError(
+                message="OpenAI API server error",
+                service="OpenAI",
+                original_error=f"HTTP {response.status_code}",
+                retry_after=self._parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        response.raise_for_status()
+
+    def _translate_error(self, error: httpx.HTTPError) -> Exception:
+        """Map an httpx transport or status error to an API exception."""
+        if isinstance(error, httpx.TimeoutException):
+            logger.error(f"OpenAI API timeout: {error}")
+            return ExternalAPITimeoutError(
+                service="OpenAI",
+                timeout=self.timeout,
+            )
+        if isinstance(error, httpx.NetworkError):
+            logger.error(f"OpenAI API network error: {error}")
+            return RetryableExternalAPIError(
+                message="Network error connecting to OpenAI API",
+                service="OpenAI",
+                original_error=str(error),
+            )
+        logger.error(f"OpenAI API HTTP error: {error}")
+        return ExternalAPIError(
+            message="OpenAI API request failed",
+            service="OpenAI",
+            original_error=str(error),
+        )
 
     async def generate_task_summary(self, title: str, description: str) -> Optional[str]:
         """
@@ -130,31 +334,174 @@ class OpenAIClient:
             logger.warning("OpenAI API key not configured, skipping summary generation")
             return None
 
-        prompt = f"""You are a task management assistant. Generate a brief, actionable summary (2-3 sentences max) for the following task.
+        payload = self._build_payload(title, description)
+        cache_key = self._cache_key(payload)
+        if self.cache:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Summary cache hit for task: {title[:50]}...")
+                return cached
 
-Task Title: {title}
+        # Coalesce concurrent identical requests onto a single API call
+        inflight = self._inflight.get(cache_key)
+        while inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leader was cancelled, not this caller: retry, possibly
+                # as the new leader
+            inflight = self._inflight.get(cache_key)
 
-Task Description: {description}
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            summary = await self._request_summary(payload, title)
+            if self.cache and summary:
+                await self.cache.set(cache_key, summary, ttl=self.cache_ttl)
+            future.set_result(summary)
+            return summary
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no followers are waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
 
-Summary:"""
+    async def generate_task_summaries_batch(
+        self, tasks: List[Tuple[str, str]]
+    ) -> List[Optional[str]]:
+        """
+        Generate summaries for several tasks with a single API call.
+        
+        Cached summaries are reused; the remaining tasks share one prompt
+        that asks for a JSON array. If the reply cannot be parsed, those
+        tasks fall back to individual requests.
+        
+        Args:
+            tasks: (title, description) pairs
+            
+        Returns:
+            One summary (or None) per task, in input order
+        """
+        if not self.api_key:
+            logger.warning("OpenAI API key not configured, skipping summary generation")
+            return [None] * len(tasks)
+
+        summaries: List[Optional[str]] = [None] * len(tasks)
+        keys = [self._cache_key(self._build_payload(*task)) for task in tasks]
+        missing = list(range(len(tasks)))
+        if self.cache:
+            cached = [await self.cache.get(key) for key in keys]
+            for index, value in enumerate(cached):
+                summaries[index] = value
+            missing = [index for index, value in enumerate(cached) if value is None]
+
+        if len(missing) == 1:
+            title, description = tasks[missing[0]]
+            summaries[missing[0]] = await self.generate_task_summary(title, description)
+        elif missing:
+            generated = await self._request_batch([tasks[index] for index in missing])
+            if generated is None:
+                generated = await asyncio.gather(
+                    *(self.generate_task_summary(*tasks[index]) for index in missing)
+                )
+            elif self.cache:
+                for index, summary in zip(missing, generated):
+                    if summary:
+                        await self.cache.set(keys[index], summary, ttl=self.cache_ttl)
+            for index, summary in zip(missing, generated):
+                summaries[index] = summary
 
+        return summaries
+
+    async def _request_batch(
+        self, tasks: List[Tuple[str, str]]
+    ) -> Optional[List[Optional[str]]]:
+        """
+        Request summaries for several tasks in one prompt.
+        
+        Returns:
+            One summary per task, or None if the reply was not a JSON array
+            of the expected length
+        """
+        prompt = _BATCH_PROMPT_TEMPLATE.format(
+            count=len(tasks),
+            tasks="\n\n".join(
+                _BATCH_TASK_TEMPLATE.format(
+                    number=number,
+                    title=title[:_MAX_TITLE_CHARS],
+                    description=description[: self.max_description_chars],
+                )
+                for number, (title, description) in enumerate(tasks, start=1)
+            ),
+        )
         payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that creates concise task summaries.",
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-            "max_tokens": 150,
-            "temperature": 0.7,
+            **self._base_payload,
+            "max_tokens": self._base_payload["max_tokens"] * len(tasks),
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        }
+
+        try:
+            response = await self._make_request(payload)
+        except (ExternalAPIError, ExternalAPITimeoutError) as e:
+            logger.error(f"Failed to generate batch summaries: {e.message}")
+            return [None] * len(tasks)
+
+        try:
+            content = response["choices"][0]["message"]["content"]
+            summaries = json.loads(content)
+        except (KeyError, IndexError, TypeError, ValueError):
+            logger.warning("OpenAI API returned an unparseable batch response")
+            return None
+
+        if not isinstance(summaries, list) or len(summaries) != len(tasks):
+            logger.warning("OpenAI API returned a batch response of the wrong length")
+            return None
+
+        logger.info(f"Successfully generated {len(tasks)} summaries in one request")
+        return [
+            (summary.strip() or None) if isinstance(summary, str) else None
+            for summary in summaries
+        ]
+
+    def _build_payload(self, title: str, description: str) -> dict:
+        """Build the single-task request payload (also the cache key source)."""
+        # Bound prompt size; the cache key is derived from the truncated text
+        prompt = _PROMPT_TEMPLATE.format(
+            title=title[:_MAX_TITLE_CHARS],
+            description=description[: self.max_description_chars],
+        )
+        return {
+            **self._base_payload,
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
         }
 
+    async def _request_summary(self, payload: dict, title: str) -> Optional[str]:
+        """
+        Call the API and extract the summary text from the response.
+        
+        Args:
+            payload: Request payload for the API
+            title: Task title (used for logging)
+            
+        Returns:
+            Generated summary string or None if generation fails
+        """
         try:
+            if self.stream:
+                summary = (await self._stream_request(payload)).strip()
+                if summary:
+                    logger.info(f"Successfully generated summary for task: {title[:50]}...")
+                    return summary
+                logger.warning("OpenAI API returned empty response")
+                return None
+
             response = await self._make_request(payload)
             
             if "choices" in response and len(response["choices"]) > 0:
@@ -172,7 +519,7 @@ Summary:"""
 
 
 # Singleton instance
-openai_client = OpenAIClient()
+openai_client = OpenAIClient(cache=build_response_cache())
 
 
 async def get_openai_client() -> OpenAIClient:
@@ -0,0 +1,110 @@
+"""
+Micro-batching of AI summary requests across concurrent callers.
+"""
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.openai_client import OpenAIClient, openai_client
+
+logger = logging.getLogger(__name__)
+
+_Pending = Tuple[str, str, asyncio.Future]
+
+
+class SummaryBatcher:
+    """
+    Coalesce summary requests that arrive within a short window.
+    
+    Callers submit (title, description) and await their own result; a
+    background worker collects up to max_size requests, waiting at most
+    window_ms after the first, and resolves them with one batch API call.
+    """
+
+    def __init__(self, client: OpenAIClient, window_ms: int = 20, max_size: int = 10):
+        self.client = client
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._queue: Optional["asyncio.Queue[_Pending]"] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, title: str, description: str) -> Optional[str]:
+        """
+        Queue a summary request and wait for its batch to complete.
+        
+        Args:
+            title: Task title
+            description: Task description
+            
+        Returns:
+            Generated summary string or None if generation fails
+        """
+        if self._worker is None or self._worker.done():
+            # The queue binds to the running loop, so it is created lazily
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((title, description, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Collect and resolve batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._resolve(batch)
+
+    async def _resolve(self, batch: List[_Pending]) -> None:
+        """Generate summaries for a batch and hand each caller its result."""
+        try:
+            summaries = await self.client.generate_task_summaries_batch(
+                [(title, description) for title, description, _ in batch]
+            )
+        except Exception as e:
+            logger.error(f"Batch summary generation failed: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), summary in zip(batch, summaries):
+            if not future.done():
+                future.set_result(summary)
+
+
+# Singleton instance (None when batching is disabled)
+summary_batcher = (
+    SummaryBatcher(
+        openai_client,
+        window_ms=settings.SUMMARY_BATCH_WINDOW_MS,
+        max_size=settings.SUMMARY_BATCH_MAX_SIZE,
+    )
+    if settings.SUMMARY_BATCH_WINDOW_MS > 0
+    else None
+)
+
+
+async def get_summary_batcher() -> Optional[SummaryBatcher]:
+    """Dependency injection for the summary batcher."""
+    return summary_batcher
@@ -1,20 +1,111 @@
 """
 Task service layer for business logic operations.
 """
+import asyncio
+import base64
+import binascii
+import json
 import logging
-from typing import List, Optional, Tuple
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple, Union
+from uuid import UUID
 
-from sqlalchemy import func, select
+import orjson
+from sqlalchemy import bindparam, delete, func, insert, select, text, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import raiseload
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
-from app.core.exceptions import DatabaseConnectionError, TaskNotFoundException
-from app.models.task import Task, TaskPriority, TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.core.config import settings
+from app.core.exceptions import (
+    DatabaseConnectionError,
+    ErrorResponseModel,
+    TaskNotFoundException,
+    ValidationError,
+)
+from app.models.task import SummaryStatus, Task, TaskPriority, TaskStatus
+from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.services.cache import ResponseCache, build_task_cache
 from app.services.openai_client import OpenAIClient
+from app.services.summary_batcher import SummaryBatcher
 
 logger = logging.getLogger(__name__)
 
+# Loader options for every task SELECT. Relationships used by the response
+# schema should be eager-loaded here (e.g. selectinload); any other lazy
+# load raises instead of issuing a hidden query inside the event loop.
+TASK_LOAD_OPTIONS = (raiseload("*"),)
+
+# Columns returned by list queries; rows expose them as attributes, which is
+# all the response schema needs, so no ORM instances are built
+TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.summary,
+    Task.summary_status,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Statements built once at import; per-call values are bound as parameters
+_INSERT_TASK = insert(Task).returning(Task)
+_SELECT_TASK_BY_ID = (
+    select(Task).options(*TASK_LOAD_OPTIONS).where(Task.id == bindparam("task_id"))
+)
+_SELECT_SUMMARY_SOURCE = select(Task.title, Task.description).where(
+    Task.id == bindparam("task_id")
+)
+_DELETE_TASK = delete(Task).where(Task.id == bindparam("task_id")).returning(Task.id)
+_LIST_TASKS = select(*TASK_LIST_COLUMNS).order_by(Task.created_at.desc(), Task.id.desc())
+_COUNT_TASKS = select(func.count()).select_from(Task)
+_ESTIMATE_TASKS = text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table")
+
+
+def parse_task_id(task_id: Union[str, UUID]) -> UUID:
+    """
+    Coerce a task ID to a UUID.
+    
+    Raises:
+        TaskNotFoundException: If task_id is not a valid UUID, since no
+            task can exist with that ID
+    """
+    if isinstance(task_id, UUID):
+        return task_id
+    try:
+        return UUID(task_id)
+    except (TypeError, ValueError):
+        raise TaskNotFoundException(task_id)
+
+
+def encode_cursor(task: Union[Task, Row]) -> str:
+    """Encode a task's (created_at, id) sort key as an opaque cursor."""
+    raw = json.dumps([task.created_at.isoformat(), str(task.id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        created_at, task_id = json.loads(raw)
+        if not (isinstance(created_at, str) and isinstance(task_id, str)):
+            raise ValueError("Cursor fields must be strings")
+        return datetime.fromisoformat(created_at), UUID(task_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise ValidationError("Invalid pagination cursor", field="cursor")
+
 
 class TaskService:
     """
@@ -22,47 +113,79 @@ class TaskService:
     Handles CRUD operations and external API integration.
     """
 
-    def __init__(self, db: AsyncSession, openai_client: Optional[OpenAIClient] = None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        openai_client: Optional[OpenAIClient] = None,
+        session_factory: Optional[async_sessionmaker] = None,
+        cache: Optional[ResponseCache] = None,
+        summary_batcher: Optional[SummaryBatcher] = None,
+    ):
         self.db = db
         self.openai_client = openai_client
+        self.session_factory = session_factory
+        self.cache = cache
+        self.cache_ttl = settings.TASK_CACHE_TTL
+        self.summary_batcher = summary_batcher
 
-    async def create_task(self, task_data: TaskCreate) -> Tuple[Task, Optional[str]]:
+    async def _generate_summary(self, title: str, description: str) -> Optional[str]:
+        """Generate a summary, batching with concurrent requests when enabled."""
+        if self.summary_batcher:
+            return await self.summary_batcher.submit(title, description)
+        return await self.openai_client.generate_task_summary(
+            title=title,
+            description=description,
+        )
+
+    async def create_task(
+        self, task_data: TaskCreate, defer_summary: bool = False
+    ) -> Tuple[Task, Optional[str]]:
         """
         Create a new task with optional AI-generated summary.
         
         Args:
             task_data: Validated task creation data
+            defer_summary: Skip inline summary generation; the caller is
+                expected to schedule refresh_summary instead
             
         Returns:
             Tuple of (created task, summary generation error if any)
         """
         summary = None
+        summary_status = None
         summary_error = None
 
         # Generate AI summary if requested and client is available
         if task_data.generate_summary and self.openai_client:
-            try:
-                summary = await self.openai_client.generate_task_summary(
-                    title=task_data.title,
-                    description=task_data.description,
-                )
-            except Exception as e:
-                logger.error(f"Summary generation failed: {e}")
-                summary_error = str(e)
+            if defer_summary:
+                summary_status = SummaryStatus.PENDING
+            else:
+                try:
+                    summary = await self._generate_summary(
+                        title=task_data.title,
+                        description=task_data.description,
+                    )
+                except Exception as e:
+                    logger.error(f"Summary generation failed: {e}")
+                    summary_error = str(e)
+                summary_status = SummaryStatus.READY if summary else SummaryStatus.FAILED
 
         try:
-            task = Task(
-                title=task_data.title,
-                description=task_data.description,
-                summary=summary,
-                priority=task_data.priority,
-                due_date=task_data.due_date,
-                status=TaskStatus.PENDING,
+            # INSERT ... RETURNING loads defaults (id, timestamps) without a refresh
+            result = await self.db.execute(
+                _INSERT_TASK,
+                {
+                    "title": task_data.title,
+                    "description": task_data.description,
+                    "summary": summary,
+                    "summary_status": summary_status,
+                    "priority": task_data.priority,
+                    "due_date": task_data.due_date,
+                    "status": TaskStatus.PENDING,
+                },
             )
-            
-            self.db.add(task)
+            task = result.scalar_one()
             await self.db.commit()
-            await self.db.refresh(task)
             
             logger.info(f"Created task with ID: {task.id}")
             return task, summary_error
@@ -72,10 +195,14 @@ class TaskService:
             logger.error(f"Database error creating task: {e}")
             raise DatabaseConnectionError(f"Failed to create task: {str(e)}")
 
-    async def get_task_by_id(self, task_id: str) -> Task:
+    async def get_task_by_id(self, task_id: Union[str, UUID]) -> Task:
         """
         Retrieve a task by its ID.
         
+        Reads through the task cache when one is configured. Tasks whose
+        summary is still pending are not cached. A task served from the
+        cache is a detached copy and must not be modified.
+        
         Args:
             task_id: UUID of the task
             
@@ -85,10 +212,43 @@ class TaskService:
         Raises:
             TaskNotFoundException: If task doesn't exist
         """
+        task_id = parse_task_id(task_id)
+        if not self.cache:
+            return await self._load_task(task_id)
+
+        key = str(task_id)
         try:
-            result = await self.db.execute(
-                select(Task).where(Task.id == task_id)
+            cached = await self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"Task cache read failed for {task_id}: {e}")
+            cached = None
+        if cached is not None:
+            return Task(**TaskResponse.model_validate_json(cached).model_dump())
+
+        task = await self._load_task(task_id)
+        if task.summary_status == SummaryStatus.PENDING:
+            # A background job is about to write the summary; its invalidation
+            # could land before this write and leave the pending row cached
+            return task
+        try:
+            await self.cache.set(
+                key,
+                TaskResponse.model_validate(task).model_dump_json(),
+                ttl=self.cache_ttl,
             )
+        except Exception as e:
+            logger.warning(f"Task cache write failed for {task_id}: {e}")
+        return task
+
+    async def _load_task(self, task_id: UUID) -> Task:
+        """
+        Load a task from the database into the session.
+        
+        Raises:
+            TaskNotFoundException: If task doesn't exist
+        """
+        try:
+            result = await self.db.execute(_SELECT_TASK_BY_ID, {"task_id": task_id})
             task = result.scalar_one_or_none()
             
             if not task:
@@ -100,104 +260,287 @@ class TaskService:
             logger.error(f"Database error fetching task {task_id}: {e}")
             raise DatabaseConnectionError(f"Failed to fetch task: {str(e)}")
 
+    async def _invalidate_task(self, task_id: UUID) -> None:
+        """Drop a task from the cache after it was written."""
+        if not self.cache:
+            return
+        try:
+            await self.cache.delete(str(task_id))
+        except Exception as e:
+            logger.warning(f"Task cache invalidation failed for {task_id}: {e}")
+
     async def get_tasks(
         self,
         page: int = 1,
         page_size: int = 10,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
-    ) -> Tuple[List[Task], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        estimate_total: bool = False,
+    ) -> Tuple[List[Row], Optional[int], bool]:
         """
         Retrieve paginated list of tasks with optional filtering.
         
+        Tasks are returned as column rows (see TASK_LIST_COLUMNS) rather
+        than ORM instances.
+        
+        When a cursor is given, keyset pagination on (created_at, id) is used
+        and page is ignored; otherwise page is translated to an OFFSET.
+        An exact total for an offset page comes from a COUNT(*) OVER ()
+        window in the same query; cursor pages and estimates count separately.
+        
         Args:
             page: Page number (1-indexed)
             page_size: Number of tasks per page
             status: Optional status filter
             priority: Optional priority filter
+            cursor: Optional cursor from a previous page
+            include_total: Whether to count all matching tasks
+            estimate_total: Use the planner's row estimate instead of an
+                exact count when no filters are applied (PostgreSQL only)
             
         Returns:
-            Tuple of (list of tasks, total count)
+            Tuple of (list of task rows, total count or None, whether more pages exist)
         """
+        after = decode_cursor(cursor) if cursor else None
+
         try:
-            # Build query with filters
-            query = select(Task)
-            count_query = select(func.count()).select_from(Task)
-            
-            if status:
-                query = query.where(Task.status == status)
-                count_query = count_query.where(Task.status == status)
-            
-            if priority:
-                query = query.where(Task.priority == priority)
-                count_query = count_query.where(Task.priority == priority)
-            
-            # Get total count
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
-            
-            # Apply pagination and ordering
-            offset = (page - 1) * page_size
-            query = query.order_by(Task.created_at.desc()).offset(offset).limit(page_size)
+            filters = self._build_filters(status, priority)
+
+            # Apply pagination; fetch one extra row to detect more pages
+            query = _LIST_TASKS.where(*filters)
+            if after:
+                query = query.where(tuple_(Task.created_at, Task.id) < tuple_(*after))
+            else:
+                query = query.offset((page - 1) * page_size)
+            query = query.limit(page_size + 1)
             
-            result = await self.db.execute(query)
-            tasks = list(result.scalars().all())
+            total = None
+            if include_total and not (after or estimate_total):
+                # Compute the total in the same scan; the window runs before LIMIT
+                result = await self.db.execute(
+                    query.add_columns(func.count().over().label("total"))
+                )
+                tasks = result.all()
+                # Past the last page there is no row to carry the total
+                total = tasks[0].total if tasks else await self._count_tasks(filters)
+            elif include_total and self._supports_concurrent_queries():
+                # Count on a separate pooled connection while the page loads
+                total, result = await asyncio.gather(
+                    self._count_tasks(filters, estimate=estimate_total, isolated=True),
+                    self.db.execute(query),
+                )
+                tasks = result.all()
+            else:
+                if include_total:
+                    total = await self._count_tasks(filters, estimate=estimate_total)
+                result = await self.db.execute(query)
+                tasks = result.all()
+            has_more = len(tasks) > page_size
             
-            return tasks, total
+            return tasks[:page_size], total, has_more
             
         except SQLAlchemyError as e:
             logger.error(f"Database error fetching tasks: {e}")
             raise DatabaseConnectionError(f"Failed to fetch tasks: {str(e)}")
 
+    async def stream_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream all matching tasks as NDJSON, newest first.
+        
+        Rows are fetched from a server-side cursor batch_size at a time, so
+        memory stays bounded regardless of table size. Meant to be consumed
+        by a streaming response after the request-scoped session is closed,
+        so it reads through a session from session_factory when configured.
+        
+        The response status is already sent by the time rows are read, so a
+        database error is not raised: it ends the stream with one final
+        ErrorResponseModel record (success false, error_code DATABASE_ERROR)
+        that consumers must check for instead of treating EOF as success.
+        
+        Args:
+            status: Optional status filter
+            priority: Optional priority filter
+            batch_size: Rows fetched per round-trip
+            
+        Yields:
+            One encoded batch of newline-terminated JSON task objects,
+            followed by a single error record if the database fails
+        """
+        query = _LIST_TASKS.where(
+            *self._build_filters(status, priority)
+        ).execution_options(yield_per=batch_size)
+
+        async with AsyncExitStack() as stack:
+            session = self.db
+            if self.session_factory is not None:
+                session = await stack.enter_async_context(self.session_factory())
+            try:
+                result = await session.stream(query)
+                async for rows in result.partitions():
+                    yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+            except SQLAlchemyError as e:
+                logger.error(f"Database error streaming tasks: {e}")
+                error = DatabaseConnectionError(f"Failed to stream tasks: {str(e)}")
+                yield orjson.dumps(
+                    ErrorResponseModel(
+                        error=error.message,
+                        error_code=error.error_code,
+                        details=error.details,
+                    ).model_dump()
+                ) + b"\n"
+
+    @staticmethod
+    def _build_filters(
+        status: Optional[TaskStatus], priority: Optional[TaskPriority]
+    ) -> list:
+        """Build WHERE criteria for the optional list filters."""
+        filters = []
+        if status:
+            filters.append(Task.status == status)
+        if priority:
+            filters.append(Task.priority == priority)
+        return filters
+
+    def _supports_concurrent_queries(self) -> bool:
+        """
+        Whether a second query can run alongside the session's own.
+        
+        An AsyncSession cannot execute statements concurrently, so this
+        requires checking out another connection; single-connection pools
+        (e.g. in-memory SQLite) cannot provide one.
+        """
+        bind = self.db.bind
+        return isinstance(bind, AsyncEngine) and not isinstance(
+            bind.pool, (StaticPool, SingletonThreadPool)
+        )
+
+    async def _count_tasks(
+        self, filters: list, estimate: bool = False, isolated: bool = False
+    ) -> int:
+        """
+        Count tasks matching filters.
+        
+        For an unfiltered estimate on PostgreSQL the planner statistics in
+        pg_class are used, avoiding a full COUNT(*) scan. With isolated=True
+        the count runs on its own connection instead of the session.
+        """
+        estimate = estimate and not filters and self.db.bind.dialect.name == "postgresql"
+        if isolated:
+            async with self.db.bind.connect() as conn:
+                return await self._run_count(conn, filters, estimate)
+        return await self._run_count(self.db, filters, estimate)
+
+    @staticmethod
+    async def _run_count(executor, filters: list, estimate: bool) -> int:
+        """Execute the count (or estimate) on a session or connection."""
+        if estimate:
+            result = await executor.execute(
+                _ESTIMATE_TASKS, {"table": Task.__tablename__}
+            )
+            estimated = result.scalar()
+            # reltuples is -1 until the table has been vacuumed/analyzed
+            if estimated is not None and estimated >= 0:
+                return estimated
+
+        result = await executor.execute(_COUNT_TASKS.where(*filters))
+        return result.scalar() or 0
+
     async def update_task(
-        self, task_id: str, task_data: TaskUpdate
+        self, task_id: Union[str, UUID], task_data: TaskUpdate, defer_summary: bool = False
     ) -> Tuple[Task, Optional[str]]:
         """
         Update an existing task.
         
+        Field changes are applied with a single UPDATE ... RETURNING; the
+        task is never loaded first. When the summary is regenerated, that
+        UPDATE also marks it pending and its returned title and description
+        are summarized; an inline result is stored with a second UPDATE.
+        
         Args:
             task_id: UUID of the task to update
             task_data: Validated update data
+            defer_summary: Skip inline summary regeneration; the caller is
+                expected to schedule refresh_summary instead
             
         Returns:
             Tuple of (updated task, summary generation error if any)
         """
-        task = await self.get_task_by_id(task_id)
-        summary_error = None
+        # Update provided fields
+        update_data = {
+            field: value
+            for field, value in task_data.model_dump(
+                exclude_unset=True, exclude={"regenerate_summary"}
+            ).items()
+            if value is not None
+        }
+        regenerate = bool(task_data.regenerate_summary and self.openai_client)
+        if regenerate:
+            update_data["summary_status"] = SummaryStatus.PENDING
+
+        if not update_data:
+            return await self.get_task_by_id(task_id), None
 
+        task = await self._update_returning(task_id, update_data)
+        if not regenerate or defer_summary:
+            return task, None
+
+        # Regenerate summary from the updated title and description
+        new_summary = None
+        summary_error = None
         try:
-            # Update provided fields
-            update_data = task_data.model_dump(exclude_unset=True, exclude={"regenerate_summary"})
-            
-            for field, value in update_data.items():
-                if value is not None:
-                    setattr(task, field, value)
+            new_summary = await self._generate_summary(
+                title=task.title,
+                description=task.description,
+            )
+        except Exception as e:
+            logger.error(f"Summary regeneration failed: {e}")
+            summary_error = str(e)
 
-            # Regenerate summary if requested
-            if task_data.regenerate_summary and self.openai_client:
-                try:
-                    new_summary = await self.openai_client.generate_task_summary(
-                        title=task.title,
-                        description=task.description,
-                    )
-                    if new_summary:
-                        task.summary = new_summary
-                except Exception as e:
-                    logger.error(f"Summary regeneration failed: {e}")
-                    summary_error = str(e)
+        values = (
+            {"summary": new_summary, "summary_status": SummaryStatus.READY}
+            if new_summary
+            else {"summary_status": SummaryStatus.FAILED}
+        )
+        return await self._update_returning(task.id, values), summary_error
 
+    async def _update_returning(self, task_id: Union[str, UUID], values: dict) -> Task:
+        """
+        Apply column values with a single UPDATE ... RETURNING.
+        
+        Raises:
+            TaskNotFoundException: If no row matched task_id
+        """
+        task_id = parse_task_id(task_id)
+        try:
+            result = await self.db.execute(
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**values)
+                .returning(Task)
+                .execution_options(populate_existing=True)
+            )
+            task = result.scalar_one_or_none()
+            if not task:
+                raise TaskNotFoundException(task_id)
             await self.db.commit()
-            await self.db.refresh(task)
+            await self._invalidate_task(task_id)
             
             logger.info(f"Updated task with ID: {task.id}")
-            return task, summary_error
+            return task
             
         except SQLAlchemyError as e:
             await self.db.rollback()
             logger.error(f"Database error updating task {task_id}: {e}")
             raise DatabaseConnectionError(f"Failed to update task: {str(e)}")
 
-    async def delete_task(self, task_id: str) -> str:
+    async def delete_task(self, task_id: Union[str, UUID]) -> UUID:
         """
         Delete a task by its ID.
         
@@ -210,16 +553,105 @@ class TaskService:
         Raises:
             TaskNotFoundException: If task doesn't exist
         """
-        task = await self.get_task_by_id(task_id)
+        task_id = parse_task_id(task_id)
 
         try:
-            await self.db.delete(task)
+            result = await self.db.execute(_DELETE_TASK, {"task_id": task_id})
+            deleted_id = result.scalar_one_or_none()
+            if deleted_id is None:
+                raise TaskNotFoundException(task_id)
             await self.db.commit()
+            await self._invalidate_task(task_id)
             
-            logger.info(f"Deleted task with ID: {task_id}")
-            return task_id
+            logger.info(f"Deleted task with ID: {deleted_id}")
+            return deleted_id
             
         except SQLAlchemyError as e:
             await self.db.rollback()
             logger.error(f"Database error deleting task {task_id}: {e}")
             raise DatabaseConnectionError(f"Failed to delete task: {str(e)}")
+
+    async def refresh_summary(self, task_id: Union[str, UUID]) -> Optional[str]:
+        """
+        Generate and store the AI summary for an existing task.
+        
+        Intended to run as a background job after the response is sent, so
+        it uses a fresh session from session_factory when one is configured
+        (the request-scoped session is closed by then). Failures are logged
+        rather than raised since there is no caller to report them to.
+        
+        Args:
+            task_id: UUID of the task to summarize
+            
+        Returns:
+            The stored summary, or None if none was generated
+        """
+        if not self.openai_client:
+            return None
+
+        try:
+            task_id = parse_task_id(task_id)
+        except TaskNotFoundException:
+            logger.warning(f"Invalid task ID {task_id}, skipping summary")
+            return None
+
+        if self.session_factory is None:
+            summary = await self._refresh_summary(self.db, task_id)
+        else:
+            async with self.session_factory() as session:
+                summary = await self._refresh_summary(session, task_id)
+
+        await self._invalidate_task(task_id)
+        return summary
+
+    async def _refresh_summary(self, session: AsyncSession, task_id: UUID) -> Optional[str]:
+        """Generate the task's summary and persist it with its final status."""
+        try:
+            result = await session.execute(_SELECT_SUMMARY_SOURCE, {"task_id": task_id})
+            row = result.one_or_none()
+            if row is None:
+                logger.warning(f"Task {task_id} no longer exists, skipping summary")
+                return None
+
+            summary = await self._generate_summary(
+                title=row.title,
+                description=row.description,
+            )
+            values = (
+                {"summary": summary, "summary_status": SummaryStatus.READY}
+                if summary
+                else {"summary_status": SummaryStatus.FAILED}
+            )
+            await session.execute(update(Task).where(Task.id == task_id).values(**values))
+            await session.commit()
+            logger.info(f"Stored summary status {values['summary_status'].value} for task {task_id}")
+            return summary
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Background summary generation failed for task {task_id}: {e}")
+            await self._mark_summary_failed(session, task_id)
+            return None
+
+    @staticmethod
+    async def _mark_summary_failed(session: AsyncSession, task_id: UUID) -> None:
+        """Best-effort transition of a task's summary status to failed."""
+        try:
+            await session.execute(
+                update(Task)
+                .where(Task.id == task_id)
+                .values(summary_status=SummaryStatus.FAILED)
+            )
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.error(f"Failed to mark summary as failed for task {task_id}: {e}")
+
+
+# Singleton task cache (None unless Redis is configured)
+task_cache = build_task_cache()
+
+
+async def get_task_cache() -> Optional[ResponseCache]:
+    """Dependency injection for the task cache."""
+    return task_cache
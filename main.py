@@ -3,13 +3,18 @@ AI-Powered Task Summarizer API
 Main application entry point
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as api_router
 from app.core.config import settings
 from app.core.exceptions import setup_exception_handlers
 from app.db.database import init_db
+from app.services.openai_client import openai_client
+from app.services.summary_batcher import summary_batcher
 
 
 @asynccontextmanager
@@ -18,7 +23,10 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize database
     await init_db()
     yield
-    # Shutdown: Cleanup resources if needed
+    # Shutdown: Stop summary batching and release pooled connections
+    if summary_batcher:
+        await summary_batcher.aclose()
+    await openai_client.aclose()
 
 
 def create_application() -> FastAPI:
@@ -29,6 +37,7 @@ def create_application() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -53,7 +62,11 @@ def create_application() -> FastAPI:
 app = create_application()
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
+# Encoded once; liveness probes hit this endpoint continuously
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": settings.APP_NAME})
+
+
+@app.get("/health", tags=["Health"], response_class=Response)
+async def health_check() -> Response:
     """Health check endpoint to verify service status."""
-    return {"status": "healthy", "service": settings.APP_NAME}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -0,0 +1,45 @@
+"""Create the tasks table as originally defined by the models
+
+Revision ID: 0000_initial_schema
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.task import TaskPriority, TaskStatus
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0000_initial_schema"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("status", sa.Enum(TaskStatus, name="taskstatus"), nullable=False),
+        sa.Column("priority", sa.Enum(TaskPriority, name="taskpriority"), nullable=False),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("idx_tasks_status", "tasks", ["status"])
+    op.create_index("idx_tasks_priority", "tasks", ["priority"])
+    op.create_index("idx_tasks_created_at", "tasks", ["created_at"])
+    op.create_index("idx_tasks_due_date", "tasks", ["due_date"])
+
+
+def downgrade() -> None:
+    op.drop_table("tasks")
+    sa.Enum(TaskPriority, name="taskpriority").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(TaskStatus, name="taskstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,73 @@
+"""Add summary_status and replace per-column task indexes with listing-shaped ones
+
+Revision ID: 0001_listing_indexes
+Revises: 0000_initial_schema
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.task import SummaryStatus
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_listing_indexes"
+down_revision: Union[str, None] = "0000_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes from 0000_initial_schema that the composite indexes replace.
+# idx_tasks_priority and idx_tasks_due_date are kept: priority-only filters
+# cannot use the composite's leading status column, and the partial due-date
+# index only covers pending tasks.
+_REPLACED_INDEXES = {
+    "idx_tasks_status": ["status"],
+    "idx_tasks_created_at": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    # summary_status was added to the model after the original create_all schema
+    summary_status = sa.Enum(SummaryStatus, name="summarystatus")
+    summary_status.create(op.get_bind(), checkfirst=True)
+    op.add_column("tasks", sa.Column("summary_status", summary_status, nullable=True))
+
+    # idx_tasks_status_priority_created only exists on databases built by
+    # create_all from an intermediate model, and is dropped when present
+    for name in ["idx_tasks_status_priority_created", *_REPLACED_INDEXES]:
+        op.drop_index(name, table_name="tasks", if_exists=True)
+
+    op.create_index(
+        "idx_tasks_status_priority_created_desc",
+        "tasks",
+        ["status", "priority", sa.text("created_at DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_tasks_created_id",
+        "tasks",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_tasks_pending_due",
+        "tasks",
+        ["due_date"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tasks_pending_due", table_name="tasks", if_exists=True)
+    op.drop_index("idx_tasks_created_id", table_name="tasks", if_exists=True)
+    op.drop_index("idx_tasks_status_priority_created_desc", table_name="tasks", if_exists=True)
+
+    for name, columns in _REPLACED_INDEXES.items():
+        op.create_index(name, "tasks", columns, if_not_exists=True)
+
+    op.drop_column("tasks", "summary_status")
+    sa.Enum(SummaryStatus, name="summarystatus").drop(op.get_bind(), checkfirst=True)
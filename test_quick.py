@@ -37,20 +37,24 @@ async def test_api():
         
         task_id = created_task['id']
         
+        # Tests 3 & 4: independent reads, issued concurrently
+        r_all, r_one = await asyncio.gather(
+            client.get('/api/v1/tasks/?include_total=true'),
+            client.get(f'/api/v1/tasks/{task_id}'),
+        )
+
         # Test 3: Get all tasks
         print("\n3. Testing Get All Tasks (GET)...")
-        r = await client.get('/api/v1/tasks/')
-        print(f"   Status: {r.status_code}")
-        data = r.json()
+        print(f"   Status: {r_all.status_code}")
+        data = r_all.json()
         print(f"   Total tasks: {data['total']}")
-        assert r.status_code == 200, "Get tasks failed!"
+        assert r_all.status_code == 200, "Get tasks failed!"
         print("   ✓ Get tasks PASSED")
         
         # Test 4: Get task by ID
         print(f"\n4. Testing Get Task by ID (GET /{task_id})...")
-        r = await client.get(f'/api/v1/tasks/{task_id}')
-        print(f"   Status: {r.status_code}")
-        assert r.status_code == 200, "Get task by ID failed!"
+        print(f"   Status: {r_one.status_code}")
+        assert r_one.status_code == 200, "Get task by ID failed!"
         print("   ✓ Get task by ID PASSED")
         
         # Test 5: Update task
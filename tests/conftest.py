@@ -1,67 +1,115 @@
 """
 Pytest configuration and fixtures for testing.
 """
-import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Awaitable, Callable, Generator, List
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
-from app.db.database import Base, get_db
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base, get_db, get_session_factory
+from app.models.task import Task, TaskPriority, TaskStatus
 from app.services.openai_client import OpenAIClient, get_openai_client
 from main import app
 
 
-# Use SQLite for testing (in-memory)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+def pytest_collection_modifyitems(items) -> None:
+    """Run every async test on the session event loop shared with the fixtures."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Use SQLite for testing (in-memory)
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per session."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        # Let SQLAlchemy, not the sqlite3 driver, emit BEGIN so SAVEPOINTs work
+        dbapi_connection.isolation_level = None
+        # Tests need no durability
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
     yield engine
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        test_engine,
+async def test_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open a connection whose outer transaction is rolled back after the test."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+def _session_maker(connection: AsyncConnection) -> async_sessionmaker:
+    """Session factory whose commits only release a SAVEPOINT on connection."""
+    return async_sessionmaker(
+        bind=connection,
         class_=AsyncSession,
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
-    
-    async with async_session_maker() as session:
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_session(test_connection) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session."""
+    async with _session_maker(test_connection)() as session:
         yield session
 
 
+@pytest.fixture
+def query_counter(test_engine) -> Generator[list, None, None]:
+    """Record SQL statements executed on the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # SAVEPOINTs stand in for commits under the per-test outer transaction
+        if "SAVEPOINT" not in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture
 def mock_openai_client() -> MagicMock:
     """Create a mock OpenAI client."""
@@ -73,7 +121,9 @@ def mock_openai_client() -> MagicMock:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_session, mock_openai_client) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    test_connection, test_session, mock_openai_client
+) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client with mocked dependencies."""
     
     async def override_get_db():
@@ -81,9 +131,13 @@ async def client(test_session, mock_openai_client) -> AsyncGenerator[AsyncClient
     
     def override_get_openai_client():
         return mock_openai_client
+
+    def override_get_session_factory():
+        return _session_maker(test_connection)
     
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_openai_client] = override_get_openai_client
+    app.dependency_overrides[get_session_factory] = override_get_session_factory
     
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -94,6 +148,30 @@ async def client(test_session, mock_openai_client) -> AsyncGenerator[AsyncClient
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def seed_tasks(test_session) -> Callable[..., Awaitable[List[Task]]]:
+    """Factory that inserts n tasks in one flush; keyword args override columns."""
+
+    async def _seed(n: int, **overrides) -> List[Task]:
+        tasks = [
+            Task(
+                **{
+                    "title": f"Task {i}",
+                    "description": "Preloaded task for list endpoint tests.",
+                    "priority": TaskPriority.HIGH,
+                    "status": TaskStatus.PENDING,
+                    **overrides,
+                }
+            )
+            for i in range(n)
+        ]
+        test_session.add_all(tasks)
+        await test_session.commit()
+        return tasks
+
+    return _seed
+
+
 @pytest.fixture
 def sample_task_data() -> dict:
     """Sample task data for testing."""
@@ -2,9 +2,13 @@
 Integration tests for Task API endpoints.
 Tests the full request/response cycle with mocked external dependencies.
 """
+import json
+
 import pytest
 from httpx import AsyncClient
 
+from app.models.task import TaskPriority
+
 
 class TestHealthEndpoint:
     """Integration tests for health check endpoint."""
@@ -15,6 +19,7 @@ class TestHealthEndpoint:
         response = await client.get("/health")
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert data["status"] == "healthy"
 
@@ -29,14 +34,21 @@ class TestCreateTaskEndpoint:
         """Test successful task creation with AI summary."""
         response = await client.post("/api/v1/tasks/", json=sample_task_data)
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
         assert data["title"] == sample_task_data["title"]
         assert data["description"] == sample_task_data["description"]
         assert data["priority"] == sample_task_data["priority"]
         assert data["status"] == "pending"
         assert data["id"] is not None
-        assert data["summary"] is not None  # AI-generated summary
+        assert data["summary"] is None  # Generated in the background
+        assert data["summary_status"] == "pending"
+        assert response.headers["location"].endswith(f"/api/v1/tasks/{data['id']}")
+
+        # Background job has stored the AI-generated summary
+        get_response = await client.get(response.headers["location"])
+        assert get_response.json()["summary"] is not None
+        assert get_response.json()["summary_status"] == "ready"
 
     @pytest.mark.asyncio
     async def test_create_task_without_summary(
@@ -48,6 +60,7 @@ class TestCreateTaskEndpoint:
         assert response.status_code == 201
         data = response.json()
         assert data["title"] == sample_task_data_no_summary["title"]
+        assert data["summary_status"] is None
 
     @pytest.mark.asyncio
     async def test_create_task_validation_error_empty_title(self, client: AsyncClient):
@@ -93,7 +106,7 @@ class TestGetTasksEndpoint:
     @pytest.mark.asyncio
     async def test_get_tasks_empty(self, client: AsyncClient):
         """Test getting tasks when none exist."""
-        response = await client.get("/api/v1/tasks/")
+        response = await client.get("/api/v1/tasks/?include_total=true")
 
         assert response.status_code == 200
         data = response.json()
@@ -102,32 +115,29 @@ class TestGetTasksEndpoint:
 
     @pytest.mark.asyncio
     async def test_get_tasks_with_data(
-        self, client: AsyncClient, sample_task_data: dict
+        self, client: AsyncClient, seed_tasks, query_counter: list
     ):
         """Test getting tasks after creating some."""
-        # Create a task first
-        await client.post("/api/v1/tasks/", json=sample_task_data)
+        await seed_tasks(1)
 
-        response = await client.get("/api/v1/tasks/")
+        query_counter.clear()
+        response = await client.get("/api/v1/tasks/?include_total=true")
 
         assert response.status_code == 200
+        assert len(query_counter) <= 2
         data = response.json()
         assert len(data["tasks"]) == 1
         assert data["total"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_tasks_pagination(
-        self, client: AsyncClient, sample_task_data: dict
-    ):
+    async def test_get_tasks_pagination(self, client: AsyncClient, seed_tasks):
         """Test pagination of task list."""
-        # Create multiple tasks
-        for i in range(5):
-            task = sample_task_data.copy()
-            task["title"] = f"Task {i}"
-            await client.post("/api/v1/tasks/", json=task)
+        await seed_tasks(5)
 
         # Get first page
-        response = await client.get("/api/v1/tasks/?page=1&page_size=2")
+        response = await client.get(
+            "/api/v1/tasks/?page=1&page_size=2&include_total=true"
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -136,36 +146,84 @@ class TestGetTasksEndpoint:
         assert data["page"] == 1
         assert data["page_size"] == 2
         assert data["total_pages"] == 3
+        assert data["has_more"] is True
+        assert data["next_cursor"] is not None
 
     @pytest.mark.asyncio
-    async def test_get_tasks_filter_by_priority(
-        self, client: AsyncClient, sample_task_data: dict
-    ):
-        """Test filtering tasks by priority."""
-        # Create tasks with different priorities
-        high_task = sample_task_data.copy()
-        high_task["priority"] = "high"
-        await client.post("/api/v1/tasks/", json=high_task)
+    async def test_get_tasks_follows_cursor(self, client: AsyncClient, seed_tasks):
+        """Test that walking next_cursor visits every task exactly once."""
+        # Rows keep their default created_at, as they would when created via the API
+        await seed_tasks(5)
+
+        seen_ids = []
+        url = "/api/v1/tasks/?page_size=2"
+        for _ in range(5):  # More pages than needed, in case the cursor loops
+            data = (await client.get(url)).json()
+            seen_ids.extend(task["id"] for task in data["tasks"])
+            if not data["has_more"]:
+                break
+            url = f"/api/v1/tasks/?page_size=2&cursor={data['next_cursor']}"
+
+        assert len(seen_ids) == 5
+        assert len(set(seen_ids)) == 5
+        assert data["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_total_is_opt_in(self, client: AsyncClient, seed_tasks):
+        """Test that total is omitted unless include_total is requested."""
+        await seed_tasks(1)
+
+        response = await client.get("/api/v1/tasks/")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["tasks"]) == 1
+        assert data["total"] is None
+        assert data["total_pages"] is None
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_invalid_cursor(self, client: AsyncClient):
+        """Test that a malformed cursor returns 422."""
+        response = await client.get("/api/v1/tasks/?cursor=not-a-cursor")
+
+        assert response.status_code == 422
 
-        low_task = sample_task_data.copy()
-        low_task["title"] = "Low priority task"
-        low_task["priority"] = "low"
-        await client.post("/api/v1/tasks/", json=low_task)
+    @pytest.mark.asyncio
+    async def test_get_tasks_filter_by_priority(self, client: AsyncClient, seed_tasks):
+        """Test filtering tasks by priority."""
+        await seed_tasks(3, priority=TaskPriority.HIGH)
+        await seed_tasks(2, priority=TaskPriority.LOW)
 
-        # Filter by high priority
         response = await client.get("/api/v1/tasks/?priority=high")
 
         assert response.status_code == 200
         data = response.json()
+        assert len(data["tasks"]) == 3
         assert all(task["priority"] == "high" for task in data["tasks"])
 
+    @pytest.mark.asyncio
+    async def test_stream_tasks(self, client: AsyncClient, seed_tasks):
+        """Test streaming tasks as NDJSON with the list item shape."""
+        await seed_tasks(2, priority=TaskPriority.HIGH)
+        await seed_tasks(1, priority=TaskPriority.LOW)
+
+        response = await client.get("/api/v1/tasks/stream?priority=high")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        listed = (await client.get("/api/v1/tasks/?priority=high")).json()["tasks"]
+        assert lines == listed
+
 
 class TestGetTaskByIdEndpoint:
     """Integration tests for GET /api/v1/tasks/{task_id} endpoint."""
 
     @pytest.mark.asyncio
     async def test_get_task_by_id_success(
-        self, client: AsyncClient, sample_task_data: dict
+        self, client: AsyncClient, sample_task_data: dict, query_counter: list
     ):
         """Test getting a task by its ID."""
         # Create a task
@@ -173,9 +231,11 @@ class TestGetTaskByIdEndpoint:
         task_id = create_response.json()["id"]
 
         # Get it by ID
+        query_counter.clear()
         response = await client.get(f"/api/v1/tasks/{task_id}")
 
         assert response.status_code == 200
+        assert len(query_counter) <= 2
         data = response.json()
         assert data["id"] == task_id
         assert data["title"] == sample_task_data["title"]
@@ -195,7 +255,7 @@ class TestUpdateTaskEndpoint:
 
     @pytest.mark.asyncio
     async def test_update_task_success(
-        self, client: AsyncClient, sample_task_data: dict
+        self, client: AsyncClient, sample_task_data: dict, query_counter: list
     ):
         """Test updating a task."""
         # Create a task
@@ -207,9 +267,11 @@ class TestUpdateTaskEndpoint:
             "title": "Updated Title",
             "status": "in_progress",
         }
+        query_counter.clear()
         response = await client.put(f"/api/v1/tasks/{task_id}", json=update_data)
 
         assert response.status_code == 200
+        assert len(query_counter) <= 2
         data = response.json()
         assert data["title"] == "Updated Title"
         assert data["status"] == "in_progress"
@@ -218,7 +280,7 @@ class TestUpdateTaskEndpoint:
 
     @pytest.mark.asyncio
     async def test_update_task_regenerate_summary(
-        self, client: AsyncClient, sample_task_data: dict
+        self, client: AsyncClient, sample_task_data: dict, mock_openai_client
     ):
         """Test regenerating summary during update."""
         # Create a task
@@ -226,12 +288,15 @@ class TestUpdateTaskEndpoint:
         task_id = create_response.json()["id"]
 
         # Update with summary regeneration
+        mock_openai_client.generate_task_summary.return_value = "Regenerated summary."
         update_data = {"regenerate_summary": True}
         response = await client.put(f"/api/v1/tasks/{task_id}", json=update_data)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["summary"] is not None
+        assert response.status_code == 202
+        assert response.json()["summary_status"] == "pending"
+
+        get_response = await client.get(f"/api/v1/tasks/{task_id}")
+        assert get_response.json()["summary"] == "Regenerated summary."
 
     @pytest.mark.asyncio
     async def test_update_task_not_found(self, client: AsyncClient):
@@ -264,7 +329,7 @@ class TestDeleteTaskEndpoint:
 
     @pytest.mark.asyncio
     async def test_delete_task_success(
-        self, client: AsyncClient, sample_task_data: dict
+        self, client: AsyncClient, sample_task_data: dict, query_counter: list
     ):
         """Test deleting a task."""
         # Create a task
@@ -272,9 +337,11 @@ class TestDeleteTaskEndpoint:
         task_id = create_response.json()["id"]
 
         # Delete it
+        query_counter.clear()
         response = await client.delete(f"/api/v1/tasks/{task_id}")
 
         assert response.status_code == 200
+        assert len(query_counter) <= 2
         data = response.json()
         assert data["message"] == "Task deleted successfully"
         assert data["deleted_id"] == task_id
@@ -0,0 +1,50 @@
+"""
+Unit tests for response cache backends.
+"""
+import pytest
+
+from app.services.cache import InMemoryResponseCache
+
+
+class TestInMemoryResponseCache:
+    """Unit tests for the in-memory TTL/LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        """Test that stored values are returned on hit."""
+        cache = InMemoryResponseCache()
+        await cache.set("key", "value")
+
+        assert await cache.get("key") == "value"
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self):
+        """Test that entries past their TTL are not returned."""
+        cache = InMemoryResponseCache()
+        await cache.set("key", "value", ttl=0)
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test that the LRU entry is evicted when full."""
+        cache = InMemoryResponseCache(max_size=2)
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        assert await cache.get("a") == "1"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_delete(self):
+        """Test that deleted keys are misses and missing keys are ignored."""
+        cache = InMemoryResponseCache()
+        await cache.set("key", "value")
+        await cache.delete("key")
+        await cache.delete("missing")
+
+        assert await cache.get("key") is None
@@ -1,117 +1,144 @@
 """
 Unit tests for OpenAI client service.
 """
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
+import respx
 
-from app.core.exceptions import ExternalAPIError, ExternalAPITimeoutError
+from app.core.config import Settings
+from app.core.exceptions import (
+    ExternalAPIError,
+    RetryableExternalAPIError,
+)
+from app.services.cache import InMemoryResponseCache
 from app.services.openai_client import OpenAIClient
 
+TEST_SETTINGS = Settings(
+    _env_file=None,
+    OPENAI_API_KEY="test-api-key",
+    OPENAI_API_URL="https://api.openai.com/v1/chat/completions",
+    OPENAI_MODEL="gpt-3.5-turbo",
+    EXTERNAL_API_TIMEOUT=30,
+    EXTERNAL_API_MAX_RETRIES=3,
+    OPENAI_MAX_CONCURRENCY=8,
+    OPENAI_STREAM=False,
+    SUMMARY_MAX_DESCRIPTION_CHARS=1200,
+)
+OPENAI_BASE_URL = "https://api.openai.com"
+SUMMARY_RESPONSE = {"choices": [{"message": {"content": "This is a generated summary."}}]}
+
+
+def completion(content: str) -> httpx.Response:
+    """Build a chat completion response carrying content."""
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def sent_payload(route: respx.Route, index: int = -1) -> dict:
+    """Decode the JSON payload of a recorded call on route."""
+    return json.loads(route.calls[index].request.content)
+
 
 class TestOpenAIClient:
     """Unit tests for OpenAI client."""
 
+    @pytest.fixture(scope="class")
+    def openai_router(self) -> respx.Router:
+        """Mocked OpenAI API routes, served through each test client's transport."""
+        router = respx.Router(base_url=OPENAI_BASE_URL, assert_all_called=False)
+        router.post(url__regex=r".*/chat/completions", name="chat")
+        return router
+
+    @pytest_asyncio.fixture
+    async def client(self, openai_router: respx.Router):
+        """Fresh client per test, routed to the mocked OpenAI API."""
+        client = OpenAIClient(
+            config=TEST_SETTINGS,
+            transport=httpx.MockTransport(openai_router.async_handler),
+        )
+        yield client
+        await client.aclose()
+
+    @pytest.fixture
+    def chat_route(self, openai_router):
+        """Chat completions route, reset to a canned summary for each test."""
+        route = openai_router["chat"]
+        route.reset()
+        route.side_effect = None
+        route.return_value = httpx.Response(200, json=SUMMARY_RESPONSE)
+        return route
+
     @pytest.fixture
-    def client(self):
-        """Create an OpenAI client instance."""
-        with patch("app.services.openai_client.settings") as mock_settings:
-            mock_settings.OPENAI_API_KEY = "test-api-key"
-            mock_settings.OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
-            mock_settings.OPENAI_MODEL = "gpt-3.5-turbo"
-            mock_settings.EXTERNAL_API_TIMEOUT = 30
-            mock_settings.EXTERNAL_API_MAX_RETRIES = 3
-            return OpenAIClient()
-
-    @pytest.mark.asyncio
-    async def test_generate_summary_success(self, client):
+    def no_retry_wait(self):
+        """Skip real backoff sleeps between retries."""
+        with patch.object(
+            OpenAIClient._make_request.retry, "sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            yield mock_sleep
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_success(self, client, chat_route):
         """Test successful summary generation."""
-        mock_response = {
-            "choices": [
-                {
-                    "message": {
-                        "content": "This is a generated summary."
-                    }
-                }
-            ]
-        }
-
-        with patch.object(client, "_make_request", new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
-
-            summary = await client.generate_task_summary(
-                title="Test Task",
-                description="Test description for the task.",
-            )
+        summary = await client.generate_task_summary(
+            title="Test Task",
+            description="Test description for the task.",
+        )
 
-            assert summary == "This is a generated summary."
-            mock_request.assert_called_once()
+        assert summary == "This is a generated summary."
+        assert chat_route.call_count == 1
 
     @pytest.mark.asyncio
     async def test_generate_summary_no_api_key(self):
         """Test that missing API key returns None gracefully."""
-        with patch("app.services.openai_client.settings") as mock_settings:
-            mock_settings.OPENAI_API_KEY = ""
-            mock_settings.OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
-            mock_settings.OPENAI_MODEL = "gpt-3.5-turbo"
-            mock_settings.EXTERNAL_API_TIMEOUT = 30
-            mock_settings.EXTERNAL_API_MAX_RETRIES = 3
-
-            client = OpenAIClient()
-            summary = await client.generate_task_summary(
-                title="Test",
-                description="Test description",
-            )
+        client = OpenAIClient(config=TEST_SETTINGS.model_copy(update={"OPENAI_API_KEY": ""}))
+        summary = await client.generate_task_summary(
+            title="Test",
+            description="Test description",
+        )
+        await client.aclose()
 
-            assert summary is None
+        assert summary is None
 
     @pytest.mark.asyncio
-    async def test_generate_summary_api_error(self, client):
+    async def test_generate_summary_api_error(self, client, chat_route):
         """Test that API errors are handled gracefully."""
-        with patch.object(client, "_make_request", new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = ExternalAPIError(
-                message="API Error",
-                service="OpenAI",
-            )
+        chat_route.mock(return_value=httpx.Response(400))
 
-            summary = await client.generate_task_summary(
-                title="Test",
-                description="Test description",
-            )
+        summary = await client.generate_task_summary(
+            title="Test",
+            description="Test description",
+        )
 
-            assert summary is None
+        assert summary is None
 
     @pytest.mark.asyncio
-    async def test_generate_summary_timeout(self, client):
+    async def test_generate_summary_timeout(self, client, chat_route, no_retry_wait):
         """Test that timeout errors are handled gracefully."""
-        with patch.object(client, "_make_request", new_callable=AsyncMock) as mock_request:
-            mock_request.side_effect = ExternalAPITimeoutError(
-                service="OpenAI",
-                timeout=30,
-            )
+        chat_route.mock(side_effect=httpx.ReadTimeout("timed out"))
 
-            summary = await client.generate_task_summary(
-                title="Test",
-                description="Test description",
-            )
+        summary = await client.generate_task_summary(
+            title="Test",
+            description="Test description",
+        )
 
-            assert summary is None
+        assert summary is None
+        assert chat_route.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_generate_summary_empty_response(self, client):
+    async def test_generate_summary_empty_response(self, client, chat_route):
         """Test handling of empty API response."""
-        mock_response = {"choices": []}
-
-        with patch.object(client, "_make_request", new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        chat_route.mock(return_value=httpx.Response(200, json={"choices": []}))
 
-            summary = await client.generate_task_summary(
-                title="Test",
-                description="Test description",
-            )
+        summary = await client.generate_task_summary(
+            title="Test",
+            description="Test description",
+        )
 
-            assert summary is None
+        assert summary is None
 
     def test_get_headers(self, client):
         """Test that headers include authorization."""
@@ -120,3 +147,266 @@ class TestOpenAIClient:
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer test-api-key"
         assert headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_uses_cache(self, client, chat_route):
+        """Test that identical requests are served from the cache."""
+        client.cache = InMemoryResponseCache()
+        client.cache_ttl = 60
+        chat_route.mock(return_value=completion("Cached summary."))
+
+        first = await client.generate_task_summary(
+            title="Test", description="Test description"
+        )
+        second = await client.generate_task_summary(
+            title="Test", description="Test description"
+        )
+
+        assert first == second == "Cached summary."
+        assert chat_route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        """Test that concurrent identical requests share one API call."""
+        release = asyncio.Event()
+        seen_requests = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            seen_requests.append(request)
+            await release.wait()
+            return completion("Shared summary.")
+
+        client = OpenAIClient(
+            config=TEST_SETTINGS, transport=httpx.MockTransport(slow_handler)
+        )
+        pending = [
+            asyncio.create_task(
+                client.generate_task_summary(
+                    title="Test", description="Test description"
+                )
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        summaries = await asyncio.gather(*pending)
+        await client.aclose()
+
+        assert summaries == ["Shared summary."] * 5
+        assert len(seen_requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_follower_retries_when_leader_is_cancelled(self):
+        """Test that cancelling the leader does not cancel its followers."""
+        release = asyncio.Event()
+        seen_requests = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            seen_requests.append(request)
+            await release.wait()
+            return completion("Follower summary.")
+
+        client = OpenAIClient(
+            config=TEST_SETTINGS, transport=httpx.MockTransport(slow_handler)
+        )
+        leader = asyncio.create_task(
+            client.generate_task_summary(title="Test", description="Test description")
+        )
+        while not seen_requests:  # Leader's request is in flight
+            await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            client.generate_task_summary(title="Test", description="Test description")
+        )
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        summary = await follower
+        await client.aclose()
+
+        assert leader.cancelled()
+        assert summary == "Follower summary."
+        assert len(seen_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_make_request_reuses_shared_client(self, client, chat_route):
+        """Test that requests go through the shared client with its headers."""
+        await client._make_request({"model": "gpt-3.5-turbo"})
+        await client._make_request({"model": "gpt-3.5-turbo"})
+
+        seen_headers = [call.request.headers["Authorization"] for call in chat_route.calls]
+        assert seen_headers == ["Bearer test-api-key"] * 2
+
+    def test_parse_retry_after(self, client):
+        """Test Retry-After parsing for seconds and invalid values."""
+        assert client._parse_retry_after("2") == 2.0
+        assert client._parse_retry_after(None) is None
+        assert client._parse_retry_after("not-a-date") is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honors_retry_after(self, client, chat_route, no_retry_wait):
+        """Test that a 429 is retried after the server's Retry-After hint."""
+        chat_route.mock(return_value=httpx.Response(429, headers={"Retry-After": "3"}))
+
+        with pytest.raises(RetryableExternalAPIError):
+            await client._make_request({"model": "gpt-3.5-turbo"})
+
+        assert no_retry_wait.await_args_list == [((3.0,),), ((3.0,),)]
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, client, chat_route, no_retry_wait):
+        """Test that a transient 5xx recovers on retry."""
+        chat_route.mock(side_effect=[
+            httpx.Response(503),
+            httpx.Response(200, json={"choices": []}),
+        ])
+
+        response = await client._make_request({"model": "gpt-3.5-turbo"})
+
+        assert response == {"choices": []}
+        no_retry_wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_auth_error_is_not_retried(self, client, chat_route, no_retry_wait):
+        """Test that non-transient errors fail immediately."""
+        chat_route.mock(return_value=httpx.Response(401))
+
+        with pytest.raises(ExternalAPIError):
+            await client._make_request({"model": "gpt-3.5-turbo"})
+
+        no_retry_wait.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_payload(self, client, chat_route):
+        """Test that the payload combines fixed parameters with the prompt."""
+        await client.generate_task_summary(
+            title="Payload Task", description="Test description"
+        )
+
+        payload = sent_payload(chat_route)
+        assert payload["model"] == "gpt-3.5-turbo"
+        assert payload["max_tokens"] == 150
+        assert payload["temperature"] == 0.7
+        assert payload["messages"][0]["role"] == "system"
+        assert "Payload Task" in payload["messages"][1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_truncates_description(self, client, chat_route):
+        """Test that long descriptions are truncated before prompting."""
+        client.cache = InMemoryResponseCache()
+        client.cache_ttl = 60
+        prefix = "x" * 1200
+
+        await client.generate_task_summary(title="Long", description=prefix + "a")
+        await client.generate_task_summary(title="Long", description=prefix + "b")
+
+        prompt = sent_payload(chat_route)["messages"][1]["content"]
+        assert prefix in prompt
+        assert prefix + "a" not in prompt
+        # Inputs equal after truncation share a cache entry
+        assert chat_route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_request_stops_after_max_sentences(self, client, chat_route):
+        """Test that streamed content is assembled and cut off early."""
+        chunks = ["One.", " Two!", " Three?", " Four."]
+        body = "".join(
+            f'data: {{"choices": [{{"delta": {{"content": "{chunk}"}}}}]}}\n\n'
+            for chunk in chunks
+        ) + "data: [DONE]\n\n"
+        chat_route.mock(return_value=httpx.Response(200, text=body))
+
+        text = await client._stream_request({"model": "gpt-3.5-turbo"})
+
+        assert text == "One. Two! Three?"
+        assert sent_payload(chat_route)["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_request_counts_sentences_across_chunks(self, client, chat_route):
+        """Test that a period split from its continuation does not end a sentence."""
+        chunks = ["Version 3.", "14 is out.", " Two.", " Three.", " Four."]
+        body = "".join(
+            f'data: {{"choices": [{{"delta": {{"content": "{chunk}"}}}}]}}\n\n'
+            for chunk in chunks
+        )
+        chat_route.mock(return_value=httpx.Response(200, text=body))
+
+        text = await client._stream_request({"model": "gpt-3.5-turbo"})
+
+        assert text == "Version 3.14 is out. Two. Three."
+
+    @pytest.mark.parametrize(
+        "chunk",
+        [
+            pytest.param("{not json", id="invalid-json"),
+            pytest.param("[1, 2]", id="not-an-object"),
+            pytest.param('{"choices": {"0": {}}}', id="choices-dict"),
+            pytest.param('{"choices": "abc"}', id="choices-string"),
+            pytest.param('{"choices": [5]}', id="choice-not-an-object"),
+            pytest.param('{"choices": [{"delta": null}]}', id="null-delta"),
+            pytest.param('{"choices": [{"delta": {"content": 5}}]}', id="non-string-content"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_generate_summary_streaming_skips_malformed_chunks(
+        self, client, chat_route, chunk
+    ):
+        """Test that a malformed stream chunk is skipped, not raised."""
+        client.stream = True
+        body = (
+            f"data: {chunk}\n\n"
+            'data: {"choices": [{"delta": {"content": "Streamed summary."}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        chat_route.mock(return_value=httpx.Response(200, text=body))
+
+        summary = await client.generate_task_summary(title="Stream", description="Desc")
+
+        assert summary == "Streamed summary."
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_streaming_caches_result(self, client, chat_route):
+        """Test that the streamed summary is cached once complete."""
+        client.stream = True
+        client.cache = InMemoryResponseCache()
+        client.cache_ttl = 60
+        body = 'data: {"choices": [{"delta": {"content": " Streamed summary. "}}]}\n\n'
+        chat_route.mock(return_value=httpx.Response(200, text=body + "data: [DONE]\n\n"))
+
+        first = await client.generate_task_summary(title="Stream", description="Desc")
+        second = await client.generate_task_summary(title="Stream", description="Desc")
+
+        assert first == second == "Streamed summary."
+        assert chat_route.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_summaries_batch_single_call(self, client, chat_route):
+        """Test that several tasks are summarized by one request."""
+        chat_route.mock(return_value=completion('["First summary.", "Second summary."]'))
+
+        summaries = await client.generate_task_summaries_batch(
+            [("Task A", "Description A"), ("Task B", "Description B")]
+        )
+
+        assert summaries == ["First summary.", "Second summary."]
+        assert chat_route.call_count == 1
+        prompt = sent_payload(chat_route)["messages"][1]["content"]
+        assert "Task 1 Title: Task A" in prompt
+        assert "Task 2 Title: Task B" in prompt
+
+    @pytest.mark.asyncio
+    async def test_generate_summaries_batch_falls_back(self, client, chat_route):
+        """Test that an unparseable batch reply falls back to single requests."""
+        chat_route.mock(side_effect=[
+            completion("Not a JSON array."),
+            completion("Single summary."),
+            completion("Single summary."),
+        ])
+
+        summaries = await client.generate_task_summaries_batch(
+            [("Task A", "Description A"), ("Task B", "Description B")]
+        )
+
+        assert summaries == ["Single summary.", "Single summary."]
+        assert chat_route.call_count == 3
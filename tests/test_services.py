@@ -1,17 +1,32 @@
 """
 Unit tests for TaskService business logic.
 """
+import base64
+import json
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from typing import AsyncGenerator, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.exceptions import TaskNotFoundException
-from app.models.task import Task, TaskPriority, TaskStatus
+from sqlalchemy import text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.exceptions import TaskNotFoundException, ValidationError
+from app.db.database import Base
+from app.models.task import SummaryStatus, Task, TaskPriority, TaskStatus
 from app.schemas.task import TaskCreate, TaskUpdate
-from app.services.task_service import TaskService
+from app.services.cache import InMemoryResponseCache
+from app.services.task_service import _LIST_TASKS, TaskService, encode_cursor
+
+FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
 
 
 class TestTaskServiceCreate:
@@ -22,14 +37,43 @@ class TestTaskServiceCreate:
         """Create a TaskService instance for testing."""
         return TaskService(db=test_session, openai_client=mock_openai_client)
 
+    @pytest.fixture
+    def summary_clients(self, mock_openai_client) -> dict:
+        """OpenAI clients keyed by how summary generation should behave."""
+        failing_client = MagicMock()
+        failing_client.generate_task_summary = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+        return {"ok": mock_openai_client, "none": None, "fail": failing_client}
+
+    @pytest.mark.parametrize(
+        "generate_summary, client_kind, summary_status, expect_error",
+        [
+            pytest.param(True, "ok", SummaryStatus.READY, False, id="with-summary"),
+            pytest.param(False, "none", None, False, id="without-summary"),
+            # Generation failures are recorded, not raised
+            pytest.param(True, "fail", SummaryStatus.FAILED, True, id="summary-failure"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_create_task_with_summary(self, service: TaskService):
-        """Test creating a task with AI summary generation."""
+    async def test_create_task(
+        self,
+        test_session: AsyncSession,
+        summary_clients: dict,
+        generate_summary: bool,
+        client_kind: str,
+        summary_status: Optional[SummaryStatus],
+        expect_error: bool,
+    ):
+        """Test creating a task with, without and after a failed AI summary."""
+        service = TaskService(
+            db=test_session, openai_client=summary_clients[client_kind]
+        )
         task_data = TaskCreate(
             title="Test Task",
             description="This is a test task description for testing purposes.",
             priority=TaskPriority.HIGH,
-            generate_summary=True,
+            generate_summary=generate_summary,
         )
 
         task, error = await service.create_task(task_data)
@@ -38,31 +82,14 @@ class TestTaskServiceCreate:
         assert task.title == "Test Task"
         assert task.priority == TaskPriority.HIGH
         assert task.status == TaskStatus.PENDING
-        assert task.summary is not None  # Mock should return summary
-        assert error is None
-
-    @pytest.mark.asyncio
-    async def test_create_task_without_summary(self, test_session: AsyncSession):
-        """Test creating a task without AI summary generation."""
-        service = TaskService(db=test_session, openai_client=None)
-        
-        task_data = TaskCreate(
-            title="No Summary Task",
-            description="This task should not have an AI-generated summary.",
-            generate_summary=False,
-        )
-
-        task, error = await service.create_task(task_data)
-
-        assert task.id is not None
-        assert task.title == "No Summary Task"
-        assert task.summary is None
-        assert error is None
+        assert (task.summary is not None) is (summary_status == SummaryStatus.READY)
+        assert task.summary_status == summary_status
+        assert (error is not None) is expect_error
 
     @pytest.mark.asyncio
     async def test_create_task_with_due_date(self, service: TaskService):
         """Test creating a task with a due date."""
-        future_date = datetime.now() + timedelta(days=7)
+        future_date = FIXED_NOW + timedelta(days=7)
         task_data = TaskCreate(
             title="Task with Due Date",
             description="This task has a due date set for testing purposes.",
@@ -71,53 +98,44 @@ class TestTaskServiceCreate:
 
         task, _ = await service.create_task(task_data)
 
-        assert task.due_date is not None
-
-    @pytest.mark.asyncio
-    async def test_create_task_summary_failure_graceful(
-        self, test_session: AsyncSession
-    ):
-        """Test that summary generation failure is handled gracefully."""
-        mock_client = MagicMock()
-        mock_client.generate_task_summary = AsyncMock(
-            side_effect=Exception("API Error")
-        )
-        service = TaskService(db=test_session, openai_client=mock_client)
-
-        task_data = TaskCreate(
-            title="Task with Failed Summary",
-            description="This task will have a failed summary generation attempt.",
-            generate_summary=True,
-        )
-
-        task, error = await service.create_task(task_data)
-
-        assert task.id is not None
-        assert task.summary is None  # Summary should be None on failure
-        assert error is not None  # Error message should be captured
+        assert task.due_date == future_date
 
 
 class TestTaskServiceGet:
     """Unit tests for TaskService get methods."""
 
-    @pytest_asyncio.fixture
-    async def service_with_tasks(
-        self, test_session: AsyncSession, mock_openai_client
-    ) -> TaskService:
-        """Create a TaskService with pre-populated tasks."""
-        service = TaskService(db=test_session, openai_client=mock_openai_client)
-
-        # Create multiple tasks for testing
-        for i in range(5):
-            task_data = TaskCreate(
-                title=f"Test Task {i}",
-                description=f"This is test task number {i} for testing pagination.",
-                priority=TaskPriority.MEDIUM if i % 2 == 0 else TaskPriority.HIGH,
-                generate_summary=False,
-            )
-            await service.create_task(task_data)
+    @pytest_asyncio.fixture(scope="class")
+    async def seeded_connection(self, test_engine) -> AsyncGenerator[AsyncConnection, None]:
+        """Insert the listing tasks once per class, rolled back after its last test."""
+        async with test_engine.connect() as conn:
+            trans = await conn.begin()
+            async with AsyncSession(bind=conn) as session:
+                session.add_all([
+                    Task(
+                        title=f"Test Task {i}",
+                        description=f"This is test task number {i} for testing pagination.",
+                        priority=TaskPriority.MEDIUM if i % 2 == 0 else TaskPriority.HIGH,
+                    )
+                    for i in range(5)
+                ])
+                await session.flush()
+            yield conn
+            await trans.rollback()
 
-        return service
+    @pytest_asyncio.fixture
+    async def test_connection(
+        self, seeded_connection: AsyncConnection
+    ) -> AsyncGenerator[AsyncConnection, None]:
+        """Run each test in a SAVEPOINT on top of the seeded class transaction."""
+        savepoint = await seeded_connection.begin_nested()
+        yield seeded_connection
+        await savepoint.rollback()
+
+    @pytest.fixture
+    def service_with_tasks(self, test_session: AsyncSession) -> TaskService:
+        """Create a TaskService over the pre-populated tasks."""
+        # No client: create_task skips summary generation entirely
+        return TaskService(db=test_session, openai_client=None)
 
     @pytest.mark.asyncio
     async def test_get_task_by_id(self, service_with_tasks: TaskService):
@@ -144,19 +162,125 @@ class TestTaskServiceGet:
     @pytest.mark.asyncio
     async def test_get_tasks_pagination(self, service_with_tasks: TaskService):
         """Test paginated task retrieval."""
-        tasks, total = await service_with_tasks.get_tasks(page=1, page_size=2)
+        tasks, total, has_more = await service_with_tasks.get_tasks(
+            page=1, page_size=2, include_total=True
+        )
 
         assert len(tasks) == 2
         assert total == 5
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_total_past_last_page(self, service_with_tasks: TaskService):
+        """Test that the total is still reported for an empty page."""
+        tasks, total, has_more = await service_with_tasks.get_tasks(
+            page=10, page_size=2, include_total=True
+        )
+
+        assert tasks == []
+        assert total == 5
+        assert has_more is False
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_filtered_listing_uses_composite_index(
+        self, test_session: AsyncSession
+    ):
+        """Test that a status + priority page is an index range scan with no sort."""
+        query = _LIST_TASKS.where(
+            Task.status == TaskStatus.PENDING, Task.priority == TaskPriority.HIGH
+        ).limit(11)
+        sql = query.compile(test_session.bind, compile_kwargs={"literal_binds": True})
+
+        result = await test_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        plan = " ".join(row[-1] for row in result)
+
+        assert "idx_tasks_status_priority_created_desc" in plan
+        assert "TEMP B-TREE" not in plan
 
     @pytest.mark.asyncio
     async def test_get_tasks_filter_by_priority(self, service_with_tasks: TaskService):
         """Test filtering tasks by priority."""
-        tasks, total = await service_with_tasks.get_tasks(
-            page=1, page_size=10, priority=TaskPriority.HIGH
+        tasks, total, _ = await service_with_tasks.get_tasks(
+            page=1, page_size=10, priority=TaskPriority.HIGH, include_total=True
         )
 
-        assert all(task.priority == TaskPriority.HIGH for task in tasks)
+        assert total == 2
+        assert len(tasks) == 2
+
+
+class TestTaskServiceCursor:
+    """Unit tests for TaskService.get_tasks keyset pagination."""
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_cursor_pagination(self, test_session: AsyncSession):
+        """Test keyset pagination continues after the cursor row."""
+        service = TaskService(db=test_session, openai_client=None)
+        test_session.add_all([
+            Task(
+                title=f"Cursor Task {i}",
+                description="This task exercises keyset pagination.",
+                created_at=FIXED_NOW + timedelta(minutes=i),
+            )
+            for i in range(5)
+        ])
+        await test_session.commit()
+
+        first_page, _, _ = await service.get_tasks(page_size=2)
+        second_page, total, has_more = await service.get_tasks(
+            page_size=2, cursor=encode_cursor(first_page[-1]), include_total=True
+        )
+
+        assert [t.title for t in first_page] == ["Cursor Task 4", "Cursor Task 3"]
+        assert [t.title for t in second_page] == ["Cursor Task 2", "Cursor Task 1"]
+        assert total == 5
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_get_tasks_concurrent_count(self, tmp_path):
+        """Test that a cursor page counts on its own connection for pooled engines."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            service = TaskService(db=session, openai_client=None)
+            assert service._supports_concurrent_queries()
+
+            session.add_all([
+                Task(title=f"Pooled Task {i}", description="Counted concurrently.")
+                for i in range(3)
+            ])
+            await session.commit()
+
+            first_page, _, _ = await service.get_tasks(page_size=1)
+            tasks, total, has_more = await service.get_tasks(
+                page_size=1, cursor=encode_cursor(first_page[0]), include_total=True
+            )
+
+        await engine.dispose()
+
+        assert len(tasks) == 1
+        assert total == 3
+        assert has_more is True
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            pytest.param("not-a-cursor", id="not-base64-json"),
+            pytest.param(
+                base64.urlsafe_b64encode(b'["2020-01-01", 2]').decode("ascii"),
+                id="non-string-id",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_get_tasks_invalid_cursor(self, test_session: AsyncSession, cursor: str):
+        """Test that a malformed cursor raises a validation error."""
+        service = TaskService(db=test_session, openai_client=None)
+
+        with pytest.raises(ValidationError):
+            await service.get_tasks(cursor=cursor)
 
 
 class TestTaskServiceUpdate:
@@ -169,7 +293,8 @@ class TestTaskServiceUpdate:
         """Create a TaskService with one task."""
         service = TaskService(db=test_session, openai_client=mock_openai_client)
 
-        task_data = TaskCreate(
+        # Known-good setup data; validation is covered by the schema tests
+        task_data = TaskCreate.model_construct(
             title="Updatable Task",
             description="This task will be updated during testing.",
             priority=TaskPriority.LOW,
@@ -188,6 +313,8 @@ class TestTaskServiceUpdate:
 
         assert updated_task.title == "Updated Title"
         assert updated_task.description == task.description  # Unchanged
+        # created_at and updated_at share one clock
+        assert updated_task.updated_at >= updated_task.created_at
 
     @pytest.mark.asyncio
     async def test_update_task_status(self, service_with_task):
@@ -209,6 +336,38 @@ class TestTaskServiceUpdate:
 
         assert updated_task.summary is not None  # Mock should generate summary
 
+    @pytest.mark.asyncio
+    async def test_update_task_regenerates_from_new_fields(
+        self, service_with_task, query_counter: list
+    ):
+        """Test that regeneration uses the updated title without a pre-SELECT."""
+        service, task = service_with_task
+
+        query_counter.clear()
+        updated_task, _ = await service.update_task(
+            task.id, TaskUpdate(title="Renamed Task", regenerate_summary=True)
+        )
+
+        assert updated_task.summary_status == SummaryStatus.READY
+        assert service.openai_client.generate_task_summary.call_args.kwargs["title"] == "Renamed Task"
+        assert all(not statement.startswith("SELECT") for statement in query_counter)
+
+    @pytest.mark.asyncio
+    async def test_update_task_regeneration_failure(self, service_with_task):
+        """Test that a failed regeneration keeps the old summary and marks it failed."""
+        service, task = service_with_task
+        original_summary = task.summary
+        service.openai_client.generate_task_summary.side_effect = Exception("API down")
+
+        updated_task, error = await service.update_task(
+            task.id, TaskUpdate(regenerate_summary=True)
+        )
+
+        assert original_summary is not None
+        assert updated_task.summary == original_summary
+        assert updated_task.summary_status == SummaryStatus.FAILED
+        assert error == "API down"
+
     @pytest.mark.asyncio
     async def test_update_non_existent_task(self, test_session: AsyncSession):
         """Test updating a non-existent task raises exception."""
@@ -220,6 +379,86 @@ class TestTaskServiceUpdate:
                 TaskUpdate(title="New Title"),
             )
 
+    @pytest.mark.asyncio
+    async def test_update_missing_task_by_uuid(self, test_session: AsyncSession):
+        """Test that an UPDATE matching no row raises exception."""
+        service = TaskService(db=test_session, openai_client=None)
+
+        with pytest.raises(TaskNotFoundException):
+            await service.update_task(uuid4(), TaskUpdate(title="New Title"))
+
+    @pytest.mark.asyncio
+    async def test_update_task_deferred_regeneration(self, service_with_task):
+        """Test that a deferred regeneration only marks the summary pending."""
+        service, task = service_with_task
+        calls = service.openai_client.generate_task_summary.call_count
+
+        updated_task, _ = await service.update_task(
+            task.id, TaskUpdate(regenerate_summary=True), defer_summary=True
+        )
+
+        assert updated_task.summary_status == SummaryStatus.PENDING
+        assert service.openai_client.generate_task_summary.call_count == calls
+
+
+class TestTaskServiceRefreshSummary:
+    """Unit tests for TaskService.refresh_summary method."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_summary_stores_summary(
+        self, test_session: AsyncSession, mock_openai_client
+    ):
+        """Test that a deferred summary is generated and persisted."""
+        service = TaskService(db=test_session, openai_client=mock_openai_client)
+        task, _ = await service.create_task(
+            TaskCreate(
+                title="Deferred Summary Task",
+                description="This task gets its summary from a background job.",
+            ),
+            defer_summary=True,
+        )
+        assert task.summary is None
+        assert task.summary_status == SummaryStatus.PENDING
+
+        summary = await service.refresh_summary(task.id)
+
+        await test_session.refresh(task)
+        assert summary is not None
+        assert task.summary == summary
+        assert task.summary_status == SummaryStatus.READY
+
+    @pytest.mark.asyncio
+    async def test_refresh_summary_failure_marks_failed(
+        self, test_session: AsyncSession
+    ):
+        """Test that a failed background generation is recorded."""
+        mock_client = MagicMock()
+        mock_client.generate_task_summary = AsyncMock(return_value=None)
+        service = TaskService(db=test_session, openai_client=mock_client)
+        task, _ = await service.create_task(
+            TaskCreate(
+                title="Failing Summary Task",
+                description="This task's background summary will fail.",
+            ),
+            defer_summary=True,
+        )
+
+        assert await service.refresh_summary(task.id) is None
+
+        await test_session.refresh(task)
+        assert task.summary is None
+        assert task.summary_status == SummaryStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_refresh_summary_missing_task(
+        self, test_session: AsyncSession, mock_openai_client
+    ):
+        """Test that a deleted task is skipped without raising."""
+        service = TaskService(db=test_session, openai_client=mock_openai_client)
+
+        assert await service.refresh_summary("non-existent-id") is None
+        mock_openai_client.generate_task_summary.assert_not_called()
+
 
 class TestTaskServiceDelete:
     """Unit tests for TaskService.delete_task method."""
@@ -253,3 +492,130 @@ class TestTaskServiceDelete:
 
         with pytest.raises(TaskNotFoundException):
             await service.delete_task("non-existent-id")
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_task_by_uuid(self, test_session: AsyncSession):
+        """Test that a DELETE matching no row raises exception."""
+        service = TaskService(db=test_session, openai_client=None)
+
+        with pytest.raises(TaskNotFoundException):
+            await service.delete_task(uuid4())
+
+
+class TestTaskServiceStream:
+    """Unit tests for TaskService.stream_tasks method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_with_error_record_on_database_error(
+        self, test_session: AsyncSession, seed_tasks
+    ):
+        """Test that a mid-stream database error yields a final error record."""
+        await seed_tasks(3)
+        service = TaskService(db=test_session, openai_client=None)
+        stream = test_session.stream
+
+        async def stream_then_fail(query):
+            result = await stream(query)
+
+            async def partitions():
+                async for rows in result.partitions():
+                    yield rows
+                    raise OperationalError("SELECT", {}, Exception("connection lost"))
+
+            return MagicMock(partitions=partitions)
+
+        with patch.object(test_session, "stream", side_effect=stream_then_fail):
+            body = b"".join(
+                [chunk async for chunk in service.stream_tasks(batch_size=1)]
+            )
+
+        *tasks, error = [json.loads(line) for line in body.splitlines()]
+        assert len(tasks) == 1
+        assert error["success"] is False
+        assert error["error_code"] == "DATABASE_ERROR"
+
+
+class TestTaskServiceCache:
+    """Unit tests for the task read-through cache."""
+
+    @pytest_asyncio.fixture
+    async def cached_service(self, test_session: AsyncSession) -> TaskService:
+        """Create a TaskService with an in-memory task cache."""
+        return TaskService(
+            db=test_session, openai_client=None, cache=InMemoryResponseCache()
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_task_served_from_cache(self, cached_service: TaskService):
+        """Test that a cached task is returned without reading the database."""
+        task, _ = await cached_service.create_task(
+            TaskCreate(title="Cached Task", description="This task is read through the cache.")
+        )
+        await cached_service.get_task_by_id(task.id)
+
+        # Change the row behind the cache's back
+        await cached_service.db.execute(
+            update(Task).where(Task.id == task.id).values(title="Changed")
+        )
+
+        cached = await cached_service.get_task_by_id(task.id)
+
+        assert cached.id == task.id
+        assert cached.title == "Cached Task"
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(self, cached_service: TaskService):
+        """Test that update and delete evict the cached task."""
+        task, _ = await cached_service.create_task(
+            TaskCreate(title="Cached Task", description="This task is read through the cache.")
+        )
+        await cached_service.get_task_by_id(task.id)
+
+        await cached_service.update_task(task.id, TaskUpdate(title="Updated Title"))
+        assert (await cached_service.get_task_by_id(task.id)).title == "Updated Title"
+
+        await cached_service.delete_task(task.id)
+        with pytest.raises(TaskNotFoundException):
+            await cached_service.get_task_by_id(task.id)
+
+    @pytest.mark.asyncio
+    async def test_pending_summary_not_cached(
+        self, test_connection: AsyncConnection, test_session: AsyncSession, mock_openai_client
+    ):
+        """Test that a refresh landing between load and cache write is not masked."""
+        cache = InMemoryResponseCache()
+        service = TaskService(db=test_session, openai_client=mock_openai_client, cache=cache)
+        # The background job writes through its own session, as in production
+        worker = TaskService(
+            db=test_session,
+            openai_client=mock_openai_client,
+            session_factory=async_sessionmaker(
+                bind=test_connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            ),
+            cache=cache,
+        )
+        task, _ = await service.create_task(
+            TaskCreate(title="Polled Task", description="This task's summary is polled for."),
+            defer_summary=True,
+        )
+        task_id = task.id
+        load_task = service._load_task
+
+        async def load_then_refresh(task_id):
+            loaded = await load_task(task_id)
+            # The background job commits and invalidates before the cache write
+            await worker.refresh_summary(task_id)
+            return loaded
+
+        with patch.object(service, "_load_task", side_effect=load_then_refresh):
+            stale = await service.get_task_by_id(task_id)
+
+        assert stale.summary_status == SummaryStatus.PENDING
+        assert await cache.get(str(task_id)) is None
+
+        # The next poll is a new request with a fresh session
+        test_session.expire_all()
+        polled = await service.get_task_by_id(task_id)
+        assert polled.summary_status == SummaryStatus.READY
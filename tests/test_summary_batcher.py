@@ -0,0 +1,68 @@
+"""
+Unit tests for the summary micro-batcher.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import ExternalAPIError
+from app.services.openai_client import OpenAIClient
+from app.services.summary_batcher import SummaryBatcher
+
+
+class TestSummaryBatcher:
+    """Unit tests for SummaryBatcher."""
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        """Create a mock OpenAI client that echoes task titles."""
+        client = MagicMock(spec=OpenAIClient)
+        client.generate_task_summaries_batch = AsyncMock(
+            side_effect=lambda tasks: [f"Summary of {title}." for title, _ in tasks]
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_call(self, mock_client):
+        """Test that requests within the window are resolved by one batch."""
+        batcher = SummaryBatcher(mock_client, window_ms=50, max_size=10)
+
+        summaries = await asyncio.gather(
+            *(batcher.submit(f"Task {i}", "Description") for i in range(3))
+        )
+        await batcher.aclose()
+
+        assert summaries == ["Summary of Task 0.", "Summary of Task 1.", "Summary of Task 2."]
+        mock_client.generate_task_summaries_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_size(self, mock_client):
+        """Test that a full batch is sent without waiting for the window."""
+        batcher = SummaryBatcher(mock_client, window_ms=1000, max_size=2)
+
+        summaries = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(f"Task {i}", "Description") for i in range(4))),
+            timeout=0.5,
+        )
+        await batcher.aclose()
+
+        assert len(summaries) == 4
+        assert mock_client.generate_task_summaries_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self, mock_client):
+        """Test that a failed batch call raises in each waiting caller."""
+        mock_client.generate_task_summaries_batch.side_effect = ExternalAPIError(
+            message="API Error", service="OpenAI"
+        )
+        batcher = SummaryBatcher(mock_client, window_ms=10)
+
+        results = await asyncio.gather(
+            batcher.submit("Task A", "Description"),
+            batcher.submit("Task B", "Description"),
+            return_exceptions=True,
+        )
+        await batcher.aclose()
+
+        assert all(isinstance(result, ExternalAPIError) for result in results)